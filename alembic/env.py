@@ -28,6 +28,7 @@ if config.config_file_name is not None:
 
 # Import all models so they are registered with SQLAlchemy
 from app.db.base import Base
+from app.models.idempotency_key import IdempotencyKey
 from app.models.project import Project
 from app.models.task import Task
 
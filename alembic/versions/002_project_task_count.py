@@ -0,0 +1,39 @@
+"""Add maintained task_count counter to projects
+
+Revision ID: 002_project_task_count
+Revises: 001_initial
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_project_task_count'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'projects',
+        sa.Column('task_count', sa.Integer(), server_default='0', nullable=False),
+    )
+
+    # Backfill the counter from the existing rows
+    op.execute(
+        """
+        UPDATE projects
+        SET task_count = (
+            SELECT count(*) FROM tasks WHERE tasks.project_id = projects.id
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('projects', 'task_count')
@@ -0,0 +1,38 @@
+"""Add indexes for project task listings and the overdue scan
+
+Revision ID: 003_task_query_indexes
+Revises: 002_project_task_count
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_task_query_indexes'
+down_revision: Union[str, None] = '002_project_task_count'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tasks_project_id_created_at_id',
+        'tasks',
+        ['project_id', 'created_at', 'id'],
+    )
+    op.create_index(
+        'ix_tasks_open_deadline',
+        'tasks',
+        ['deadline'],
+        postgresql_where=sa.text("status <> 'done'"),
+        sqlite_where=sa.text("status <> 'done'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_open_deadline', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_created_at_id', table_name='tasks')
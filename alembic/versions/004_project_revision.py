@@ -0,0 +1,34 @@
+"""Add revision and updated_at to projects for conditional GETs
+
+Revision ID: 004_project_revision
+Revises: 003_task_query_indexes
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_project_revision'
+down_revision: Union[str, None] = '003_task_query_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'projects',
+        sa.Column('revision', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.add_column(
+        'projects',
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('projects', 'updated_at')
+    op.drop_column('projects', 'revision')
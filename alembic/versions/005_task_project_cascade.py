@@ -0,0 +1,47 @@
+"""Cascade project deletes to tasks in the database
+
+Revision ID: 005_task_project_cascade
+Revises: 004_project_revision
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Optional, Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_task_project_cascade'
+down_revision: Union[str, None] = '004_project_revision'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# PostgreSQL's default name for the unnamed foreign key created in 001
+FK_NAME = 'tasks_project_id_fkey'
+NAMING_CONVENTION = {'fk': '%(table_name)s_%(column_0_name)s_fkey'}
+
+
+def _replace_project_fk(ondelete: Optional[str]) -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        # SQLite cannot alter constraints in place; batch mode rebuilds the table
+        with op.batch_alter_table(
+            'tasks', recreate='always', naming_convention=NAMING_CONVENTION
+        ) as batch_op:
+            batch_op.drop_constraint(FK_NAME, type_='foreignkey')
+            batch_op.create_foreign_key(
+                FK_NAME, 'projects', ['project_id'], ['id'], ondelete=ondelete
+            )
+        return
+
+    op.drop_constraint(FK_NAME, 'tasks', type_='foreignkey')
+    op.create_foreign_key(
+        FK_NAME, 'tasks', 'projects', ['project_id'], ['id'], ondelete=ondelete
+    )
+
+
+def upgrade() -> None:
+    _replace_project_fk('CASCADE')
+
+
+def downgrade() -> None:
+    _replace_project_fk(None)
@@ -0,0 +1,36 @@
+"""Add a full-text search index on task title and description
+
+Revision ID: 006_task_search_index
+Revises: 005_task_project_cascade
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_task_search_index'
+down_revision: Union[str, None] = '005_task_project_cascade'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # PostgreSQL only; other backends search with LIKE. Built concurrently so
+    # large tasks tables stay writable while the index is created.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_search ON tasks "
+            "USING gin (to_tsvector('english'::regconfig, title || ' ' || description))"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_search')
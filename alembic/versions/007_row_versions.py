@@ -0,0 +1,34 @@
+"""Add version columns to tasks and projects for optimistic concurrency
+
+Revision ID: 007_row_versions
+Revises: 006_task_search_index
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007_row_versions'
+down_revision: Union[str, None] = '006_task_search_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'tasks',
+        sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+    )
+    op.add_column(
+        'projects',
+        sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('projects', 'version')
+    op.drop_column('tasks', 'version')
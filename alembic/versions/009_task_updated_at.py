@@ -0,0 +1,30 @@
+"""Add updated_at to tasks for incremental deadline scheduling
+
+Revision ID: 009_task_updated_at
+Revises: 008_idempotency_keys
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009_task_updated_at'
+down_revision: Union[str, None] = '008_idempotency_keys'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'tasks',
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    op.execute('UPDATE tasks SET updated_at = created_at')
+
+
+def downgrade() -> None:
+    op.drop_column('tasks', 'updated_at')
@@ -1,12 +1,61 @@
+import asyncio
 import os
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from dotenv import load_dotenv
 
 from app.api import api_v1_router
+from app.cache import get_cache
+from app.commands.scheduler import DeadlineScheduler, is_embedded_scheduler_enabled
+from app.db.session import dispose_async_engine, dispose_engine, get_pool_status
+from app.events import get_broker, get_events_backend, is_events_enabled
+from app.metrics import (
+    InstrumentationMiddleware,
+    get_request_metrics,
+    install_query_hooks,
+    is_metrics_enabled,
+    is_server_timing_enabled,
+    render_metrics,
+)
 
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    scheduler = None
+    scheduler_task = None
+    if is_embedded_scheduler_enabled():
+        scheduler = DeadlineScheduler()
+        scheduler_task = asyncio.create_task(scheduler.run())
+
+    listener = None
+    if is_events_enabled():
+        get_broker().attach(asyncio.get_running_loop())
+        if get_events_backend() == "postgres":
+            from app.events.postgres import PostgresEventListener
+
+            listener = PostgresEventListener(get_broker())
+            listener.start()
+
+    yield
+
+    if scheduler is not None:
+        scheduler.stop()
+        await scheduler_task
+
+    if listener is not None:
+        await asyncio.to_thread(listener.stop)
+    if is_events_enabled():
+        get_broker().close()
+
+    dispose_engine()
+    await dispose_async_engine()
+
+
 app = FastAPI(
     title="ToDoList API",
     description="""
@@ -16,6 +65,7 @@ A RESTful API for managing projects and tasks.
 
 * **Projects**: Create, list, and delete projects
 * **Tasks**: Add tasks to projects, update status, and manage deadlines
+* **Change feed**: Task changes per project over server-sent events or WebSocket
 * **Validation**: Automatic input/output validation with Pydantic
 * **Documentation**: Auto-generated OpenAPI documentation
 
@@ -30,6 +80,7 @@ This API follows a layered architecture:
     version="0.3.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 allowed_origins = os.getenv("CORS_ORIGINS", "*").split(",")
 app.add_middleware(
@@ -38,7 +89,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+if is_metrics_enabled() or is_server_timing_enabled():
+    install_query_hooks()
+    app.add_middleware(
+        InstrumentationMiddleware,
+        metrics=get_request_metrics() if is_metrics_enabled() else None,
+        server_timing=is_server_timing_enabled(),
+    )
 
 app.include_router(api_v1_router)
 
@@ -56,3 +115,25 @@ async def root():
 @app.get("/health", tags=["Root"])
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/health/cache", tags=["Root"])
+async def cache_stats():
+    cache = get_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, "backend": cache.name, **cache.stats.as_dict()}
+
+
+@app.get("/health/pool", tags=["Root"])
+async def pool_stats():
+    return get_pool_status()
+
+
+@app.get("/metrics", tags=["Root"], response_class=PlainTextResponse)
+async def metrics():
+    if not is_metrics_enabled():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Metrics are disabled"
+        )
+    return render_metrics()
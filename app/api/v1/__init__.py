@@ -1,11 +1,33 @@
 from fastapi import APIRouter
 
-from app.api.v1.routes import projects_router, tasks_router
+from app.api.v1.routes import (
+    async_projects_router,
+    async_tasks_router,
+    projects_router,
+    task_events_router,
+    task_export_router,
+    task_import_router,
+    task_search_router,
+    tasks_router,
+)
+from app.db.session import is_async_database_enabled
 
 api_v1_router = APIRouter(prefix="/api/v1")
 
-# Include routers
-api_v1_router.include_router(projects_router)
-api_v1_router.include_router(tasks_router)
+# Streaming routers use their own sync sessions in either mode; registered
+# first so their static paths win over /tasks/{task_id}
+api_v1_router.include_router(task_events_router)
+api_v1_router.include_router(task_export_router)
+api_v1_router.include_router(task_import_router)
+# Search reads through a sync session in either mode
+api_v1_router.include_router(task_search_router)
+
+# Include routers (DATABASE_ASYNC selects the AsyncSession-backed variants)
+if is_async_database_enabled():
+    api_v1_router.include_router(async_projects_router)
+    api_v1_router.include_router(async_tasks_router)
+else:
+    api_v1_router.include_router(projects_router)
+    api_v1_router.include_router(tasks_router)
 
 __all__ = ["api_v1_router"]
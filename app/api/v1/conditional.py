@@ -0,0 +1,79 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Set
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: object) -> str:
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def version_etag(version: int) -> str:
+    # Strong validator for a single row; If-Match only matches strong tags
+    return f'"{version}"'
+
+
+def if_match_versions(request: Request) -> Optional[Set[int]]:
+    # Row versions a client's If-Match accepts. None means no precondition
+    # (header absent or "*"); an empty set (weak or foreign tags) matches nothing.
+    if_match = request.headers.get("if-match")
+    if if_match is None:
+        return None
+
+    versions: Set[int] = set()
+    for tag in if_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return None
+        if len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit():
+            versions.add(int(tag[1:-1]))
+    return versions
+
+
+def http_date(value: datetime) -> str:
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _opaque_tag(etag: str) -> str:
+    # If-None-Match uses weak comparison
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime] = None
+) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {_opaque_tag(tag.strip()) for tag in if_none_match.split(",")}
+        return "*" in candidates or _opaque_tag(etag) in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        modified = last_modified.astimezone(timezone.utc).replace(microsecond=0)
+        return modified <= since
+    return False
+
+
+def check_conditional(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+) -> Optional[Response]:
+    # Returns a 304 to send instead of the body, or sets the validators on `response`
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,110 @@
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.cache.backends import CacheValue
+from app.db.session import get_async_db, get_db
+from app.repositories.async_idempotency_repository import AsyncIdempotencyRepository
+from app.repositories.idempotency_repository import IdempotencyRepository
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+
+def idempotency_key(request: Request) -> Optional[str]:
+    key = request.headers.get(IDEMPOTENCY_HEADER)
+    if key is not None and not 0 < len(key) <= MAX_KEY_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{IDEMPOTENCY_HEADER} must be 1 to {MAX_KEY_LENGTH} characters",
+        )
+    return key
+
+
+def request_fingerprint(request: Request, payload: BaseModel) -> str:
+    # The validated payload, so whitespace or key order changes between
+    # retries still count as the same request
+    return hashlib.sha256(
+        f"{request.method} {request.url.path}\n{payload.model_dump_json()}".encode()
+    ).hexdigest()
+
+
+def replay_response(record: CacheValue, fingerprint: str) -> Response:
+    if record["fingerprint"] != fingerprint:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{IDEMPOTENCY_HEADER} was already used for a different request",
+        )
+    if record["status_code"] is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"A request with this {IDEMPOTENCY_HEADER} is still in progress",
+        )
+    return Response(
+        record["body"],
+        status_code=record["status_code"],
+        media_type="application/json",
+        headers={REPLAYED_HEADER: "true"},
+    )
+
+
+class IdempotentRequest:
+
+    def __init__(self, repository: IdempotencyRepository, request: Request):
+        self.repository = repository
+        self.request = request
+        self.key = idempotency_key(request)
+
+    def replay(self, payload: BaseModel) -> Optional[Response]:
+        # The stored response for a repeated key; otherwise the key is claimed
+        # and None tells the route to run the request
+        if self.key is None:
+            return None
+        fingerprint = request_fingerprint(self.request, payload)
+        record = self.repository.claim(self.key, fingerprint, datetime.now())
+        return None if record is None else replay_response(record, fingerprint)
+
+    def respond(self, content: bytes, status_code: int) -> Response:
+        # Stored in the request's transaction: committed together with what
+        # the request created, or not at all
+        if self.key is not None:
+            self.repository.complete(self.key, status_code, content.decode())
+        return Response(content, status_code=status_code, media_type="application/json")
+
+
+class AsyncIdempotentRequest:
+
+    def __init__(self, repository: AsyncIdempotencyRepository, request: Request):
+        self.repository = repository
+        self.request = request
+        self.key = idempotency_key(request)
+
+    async def replay(self, payload: BaseModel) -> Optional[Response]:
+        if self.key is None:
+            return None
+        fingerprint = request_fingerprint(self.request, payload)
+        record = await self.repository.claim(self.key, fingerprint, datetime.now())
+        return None if record is None else replay_response(record, fingerprint)
+
+    async def respond(self, content: bytes, status_code: int) -> Response:
+        if self.key is not None:
+            await self.repository.complete(self.key, status_code, content.decode())
+        return Response(content, status_code=status_code, media_type="application/json")
+
+
+def get_idempotent_request(
+    request: Request, db: Session = Depends(get_db)
+) -> IdempotentRequest:
+    return IdempotentRequest(IdempotencyRepository(db), request)
+
+
+def get_async_idempotent_request(
+    request: Request, db: AsyncSession = Depends(get_async_db)
+) -> AsyncIdempotentRequest:
+    return AsyncIdempotentRequest(AsyncIdempotencyRepository(db), request)
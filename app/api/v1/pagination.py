@@ -0,0 +1,82 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, Query, status
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+Cursor = Tuple[datetime, int]
+RankCursor = Tuple[float, int]
+
+
+def _encode(key: str, entity_id: int) -> str:
+    raw = f"{key}|{entity_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> Tuple[str, int]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    key, entity_id = raw.rsplit("|", 1)
+    return key, int(entity_id)
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid pagination cursor.",
+    )
+
+
+def encode_cursor(created_at: datetime, entity_id: int) -> str:
+    return _encode(created_at.isoformat(), entity_id)
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    try:
+        created_at, entity_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), entity_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise _invalid_cursor()
+
+
+def encode_rank_cursor(rank: float, entity_id: int) -> str:
+    # repr() round-trips floats exactly, so the next page starts right after this row
+    return _encode(repr(float(rank)), entity_id)
+
+
+def decode_rank_cursor(cursor: str) -> RankCursor:
+    try:
+        rank, entity_id = _decode(cursor)
+        return float(rank), entity_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise _invalid_cursor()
+
+
+class PageParams:
+
+    def __init__(
+        self,
+        limit: int = Query(
+            DEFAULT_PAGE_SIZE,
+            ge=1,
+            le=MAX_PAGE_SIZE,
+            description="Maximum number of items to return",
+        ),
+        cursor: Optional[str] = Query(
+            None, description="Opaque cursor returned as next_cursor by a previous page"
+        ),
+    ):
+        self.limit = limit
+        self.cursor = cursor
+        self.after: Optional[Cursor] = decode_cursor(cursor) if cursor else None
+
+
+def next_cursor(items: list, has_more: bool) -> Optional[str]:
+    if not has_more or not items:
+        return None
+    last = items[-1]
+    return encode_cursor(last.created_at, last.id)
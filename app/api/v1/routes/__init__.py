@@ -1,4 +1,19 @@
 from app.api.v1.routes.projects import router as projects_router
 from app.api.v1.routes.tasks import router as tasks_router
+from app.api.v1.routes.async_projects import router as async_projects_router
+from app.api.v1.routes.async_tasks import router as async_tasks_router
+from app.api.v1.routes.task_events import router as task_events_router
+from app.api.v1.routes.task_export import router as task_export_router
+from app.api.v1.routes.task_import import router as task_import_router
+from app.api.v1.routes.task_search import router as task_search_router
 
-__all__ = ["projects_router", "tasks_router"]
+__all__ = [
+    "projects_router",
+    "tasks_router",
+    "async_projects_router",
+    "async_tasks_router",
+    "task_events_router",
+    "task_export_router",
+    "task_import_router",
+    "task_search_router",
+]
@@ -0,0 +1,163 @@
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status, Depends
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.conditional import (
+    check_conditional,
+    if_match_versions,
+    make_etag,
+    version_etag,
+)
+from app.api.v1.idempotency import AsyncIdempotentRequest, get_async_idempotent_request
+from app.api.v1.pagination import PageParams, next_cursor
+from app.api.v1.schemas import (
+    ProjectCreate,
+    ProjectPage,
+    ProjectResponse,
+    ProjectSummary,
+    ProjectWithTasksPage,
+)
+from app.api.v1.routes.projects import (
+    PROJECT_COLUMNS,
+    projects_with_tasks_etag,
+    projects_with_tasks_response,
+)
+from app.api.v1.routes.tasks import TASK_COLUMNS, error_status_code
+from app.api.v1.serialization import row_page_response
+from app.db.session import get_async_db
+from app.repositories.async_project_repository import AsyncProjectRepository
+from app.services.async_project_service import AsyncProjectService
+
+router = APIRouter(prefix="/projects", tags=["Projects"])
+
+
+def get_project_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncProjectService:
+    project_repo = AsyncProjectRepository(db)
+    return AsyncProjectService(project_repo)
+
+
+@router.post(
+    "/",
+    response_model=ProjectResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create a new project",
+    description="Create a new project with name and description. Maximum 10 projects allowed. Send an Idempotency-Key header to make retries safe: a repeated key replays the first response instead of creating again.",
+)
+async def create_project(
+    project: ProjectCreate,
+    service: AsyncProjectService = Depends(get_project_service),
+    idempotency: AsyncIdempotentRequest = Depends(get_async_idempotent_request),
+):
+    replayed = await idempotency.replay(project)
+    if replayed is not None:
+        return replayed
+
+    result = await service.create_project(project.name, project.description)
+    if not result.success:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=result.message
+        )
+
+    return await idempotency.respond(
+        to_json(ProjectResponse.model_validate(result.entity)), status.HTTP_201_CREATED
+    )
+
+
+@router.get(
+    "/",
+    response_model=Union[ProjectPage, ProjectWithTasksPage],
+    summary="List projects",
+    description="Retrieve a page of projects ordered by creation time. Pass next_cursor as cursor to fetch the following page. With include=tasks every project embeds its tasks, loaded with one extra query for the whole page.",
+)
+async def list_projects(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    include: Optional[str] = Query(
+        None, pattern="^tasks$", description="Set to 'tasks' to embed each project's tasks"
+    ),
+    service: AsyncProjectService = Depends(get_project_service),
+):
+    if include == "tasks":
+        # Checked before the page and its tasks are loaded
+        versions = await service.get_projects_page_version(page.limit, page.after)
+        not_modified = check_conditional(
+            request, response, projects_with_tasks_etag(versions, page)
+        )
+        if not_modified is not None:
+            return not_modified
+
+        projects, has_more = await service.get_projects_page_with_tasks(
+            PROJECT_COLUMNS, TASK_COLUMNS, page.limit, page.after
+        )
+        return projects_with_tasks_response(projects, has_more, response)
+
+    # A cheap count/max(id) query decides whether the page can be a 304
+    version = await service.get_projects_version()
+    etag = make_etag("projects", version, page.limit, page.cursor)
+    not_modified = check_conditional(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    rows, has_more = await service.get_projects_row_page(
+        PROJECT_COLUMNS, page.limit, page.after
+    )
+    return row_page_response(rows, next_cursor(rows, has_more), response)
+
+
+@router.get(
+    "/summary",
+    response_model=List[ProjectSummary],
+    summary="Summarize projects",
+    description="Per-project task counts by status, overdue open tasks and the next upcoming deadline, computed in a single grouped query.",
+)
+async def get_projects_summary(service: AsyncProjectService = Depends(get_project_service)):
+    return await service.get_projects_summary()
+
+
+@router.get(
+    "/{project_id}",
+    response_model=ProjectResponse,
+    summary="Get a project by ID",
+    description="Retrieve a specific project by its ID.",
+)
+async def get_project(
+    project_id: int,
+    request: Request,
+    response: Response,
+    service: AsyncProjectService = Depends(get_project_service),
+):
+    project = await service.get_project_by_id(project_id)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+    etag = version_etag(project.version)
+    not_modified = check_conditional(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    return project
+
+
+@router.delete(
+    "/{project_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete a project",
+    description="Delete a project and all its associated tasks.",
+)
+async def delete_project(
+    project_id: int,
+    request: Request,
+    service: AsyncProjectService = Depends(get_project_service),
+):
+    result = await service.delete_project(project_id, if_match_versions(request))
+    if not result.success:
+        raise HTTPException(
+            status_code=error_status_code(result.error), detail=result.message
+        )
@@ -0,0 +1,247 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status, Depends
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.conditional import check_conditional, if_match_versions, version_etag
+from app.api.v1.idempotency import AsyncIdempotentRequest, get_async_idempotent_request
+from app.api.v1.pagination import PageParams, next_cursor
+from app.api.v1.schemas import (
+    TaskBulkCreate,
+    TaskBulkStatusUpdate,
+    TaskCreate,
+    TaskPage,
+    TaskResponse,
+    TaskStatusUpdate,
+)
+from app.api.v1.routes.tasks import (
+    TASK_COLUMNS,
+    check_task_list,
+    ensure_project_task,
+    error_status_code,
+)
+from app.api.v1.serialization import row_page_response
+from app.db.session import get_async_db
+from app.repositories.async_project_repository import AsyncProjectRepository
+from app.repositories.async_task_repository import AsyncTaskRepository
+from app.services.async_task_service import AsyncTaskService
+
+router = APIRouter(prefix="/projects/{project_id}/tasks", tags=["Tasks"])
+
+
+def get_task_service(db: AsyncSession = Depends(get_async_db)) -> AsyncTaskService:
+    task_repo = AsyncTaskRepository(db)
+    project_repo = AsyncProjectRepository(db)
+    return AsyncTaskService(task_repo, project_repo)
+
+
+async def get_project_task(
+    project_id: int, task_id: int, service: AsyncTaskService
+):
+    task = await service.task_repository.get_by_id(task_id)
+    return ensure_project_task(task, project_id)
+
+
+@router.post(
+    "/",
+    response_model=TaskResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create a new task",
+    description="Create a new task in a project. Maximum 100 tasks per project allowed. Send an Idempotency-Key header to make retries safe: a repeated key replays the first response instead of creating again.",
+)
+async def create_task(
+    project_id: int,
+    task: TaskCreate,
+    service: AsyncTaskService = Depends(get_task_service),
+    idempotency: AsyncIdempotentRequest = Depends(get_async_idempotent_request),
+):
+    replayed = await idempotency.replay(task)
+    if replayed is not None:
+        return replayed
+
+    result = await service.add_task(
+        project_id, task.title, task.description, task.deadline
+    )
+    if not result.success:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=result.message
+        )
+
+    return await idempotency.respond(
+        to_json(TaskResponse.model_validate(result.entity)), status.HTTP_201_CREATED
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=List[TaskResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create tasks in bulk",
+    description="Create many tasks in a project with a single INSERT. The per-project task limit applies to the whole batch. Send an Idempotency-Key header to make retries safe: a repeated key replays the first response instead of creating again.",
+)
+async def create_tasks_bulk(
+    project_id: int,
+    payload: TaskBulkCreate,
+    service: AsyncTaskService = Depends(get_task_service),
+    idempotency: AsyncIdempotentRequest = Depends(get_async_idempotent_request),
+):
+    replayed = await idempotency.replay(payload)
+    if replayed is not None:
+        return replayed
+
+    result = await service.add_tasks(
+        project_id, [task.model_dump() for task in payload.tasks]
+    )
+    if not result.success:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=result.message
+        )
+
+    return await idempotency.respond(
+        to_json([TaskResponse.model_validate(task) for task in result.entity]),
+        status.HTTP_201_CREATED,
+    )
+
+
+@router.get(
+    "/",
+    response_model=TaskPage,
+    summary="List tasks in a project",
+    description="Retrieve a page of tasks for a specific project ordered by creation time, optionally filtered by status and deadline range.",
+)
+async def list_tasks(
+    project_id: int,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    status_filter: Optional[str] = Query(
+        None,
+        alias="status",
+        pattern="^(todo|doing|done)$",
+        description="Only tasks with this status",
+    ),
+    deadline_from: Optional[datetime] = Query(
+        None, description="Only tasks with a deadline at or after this time"
+    ),
+    deadline_to: Optional[datetime] = Query(
+        None, description="Only tasks with a deadline at or before this time"
+    ),
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    version = await service.get_tasks_version(project_id)
+    not_modified = check_task_list(
+        request,
+        response,
+        version,
+        project_id,
+        page,
+        status_filter,
+        deadline_from,
+        deadline_to,
+    )
+    if not_modified is not None:
+        return not_modified
+
+    rows, has_more = await service.get_tasks_row_page(
+        TASK_COLUMNS,
+        project_id,
+        page.limit,
+        page.after,
+        status_filter,
+        deadline_from,
+        deadline_to,
+    )
+    return row_page_response(rows, next_cursor(rows, has_more), response)
+
+
+@router.get(
+    "/{task_id}",
+    response_model=TaskResponse,
+    summary="Get a task by ID",
+    description="Retrieve a specific task by its ID.",
+)
+async def get_task(
+    project_id: int,
+    task_id: int,
+    request: Request,
+    response: Response,
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    task = await get_project_task(project_id, task_id, service)
+
+    etag = version_etag(task.version)
+    not_modified = check_conditional(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    return task
+
+
+@router.patch(
+    "/status",
+    response_model=List[TaskResponse],
+    summary="Update the status of many tasks",
+    description="Apply a list of (task_id, status) changes in one request, with one UPDATE per target status. All tasks must belong to the project or nothing is changed. Returns the tasks whose status changed.",
+)
+async def update_task_statuses(
+    project_id: int,
+    payload: TaskBulkStatusUpdate,
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    result = await service.change_task_statuses(
+        project_id, [(change.task_id, change.status) for change in payload.updates]
+    )
+    if not result.success:
+        raise HTTPException(
+            status_code=error_status_code(result.error), detail=result.message
+        )
+
+    return [dict(row) for row in result.entity]
+
+
+@router.patch(
+    "/{task_id}/status",
+    response_model=TaskResponse,
+    summary="Update task status",
+    description="Update the status of a task (todo, doing, done). Send the task's ETag in If-Match to only apply the change if the task is unchanged (412 otherwise); a write that races another one is rejected with 409.",
+)
+async def update_task_status(
+    project_id: int,
+    task_id: int,
+    status_update: TaskStatusUpdate,
+    request: Request,
+    response: Response,
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    result = await service.change_task_status(
+        task_id, status_update.status, project_id, if_match_versions(request)
+    )
+    if not result.success:
+        raise HTTPException(
+            status_code=error_status_code(result.error), detail=result.message
+        )
+
+    response.headers["ETag"] = version_etag(result.entity.version)
+    return result.entity
+
+
+@router.delete(
+    "/{task_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete a task",
+    description="Delete a specific task. Honours If-Match like the status update.",
+)
+async def delete_task(
+    project_id: int,
+    task_id: int,
+    request: Request,
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    result = await service.delete_task(
+        task_id, project_id, if_match_versions(request)
+    )
+    if not result.success:
+        raise HTTPException(
+            status_code=error_status_code(result.error), detail=result.message
+        )
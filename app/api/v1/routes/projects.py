@@ -1,49 +1,142 @@
-from typing import List
+from typing import List, Optional, Sequence, Union
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status, Depends
+from pydantic_core import to_json
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
-from app.api.v1.schemas import ProjectCreate, ProjectResponse, ProjectUpdate
+from app.api.v1.conditional import (
+    check_conditional,
+    if_match_versions,
+    make_etag,
+    version_etag,
+)
+from app.api.v1.idempotency import IdempotentRequest, get_idempotent_request
+from app.api.v1.pagination import PageParams, next_cursor
+from app.api.v1.schemas import (
+    ProjectCreate,
+    ProjectPage,
+    ProjectResponse,
+    ProjectSummary,
+    ProjectWithTasksPage,
+    ProjectUpdate,
+)
+from app.api.v1.routes.tasks import TASK_COLUMNS, error_status_code
+from app.api.v1.serialization import (
+    model_response,
+    response_columns,
+    row_page_response,
+)
 from app.db.session import get_db
-from app.exceptions import EntityNotFoundException
-from app.repositories.project_repository import ProjectRepository
+from app.models.project import Project
+from app.repositories.cached import get_project_repository
 from app.services.project_service import ProjectService
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
+PROJECT_COLUMNS = response_columns(Project, ProjectResponse)
+
 
 def get_project_service(db: Session = Depends(get_db)) -> ProjectService:
-    project_repo = ProjectRepository(db)
+    project_repo = get_project_repository(db)
     return ProjectService(project_repo)
 
 
+def projects_with_tasks_etag(versions: Sequence[Row], page: PageParams) -> str:
+    # (id, revision, version) of the page and the row after it; task writes
+    # bump the revision, so this covers the embedded tasks and next_cursor too
+    return make_etag(
+        "projects+tasks", [tuple(row) for row in versions], page.limit, page.cursor
+    )
+
+
+def projects_with_tasks_response(
+    projects: List[Project], has_more: bool, response: Response
+) -> Response:
+    content = ProjectWithTasksPage.model_validate(
+        {"items": projects, "next_cursor": next_cursor(projects, has_more)},
+        from_attributes=True,
+    )
+    return model_response(content, response)
+
+
 @router.post(
     "/",
     response_model=ProjectResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new project",
-    description="Create a new project with name and description. Maximum 10 projects allowed.",
+    description="Create a new project with name and description. Maximum 10 projects allowed. Send an Idempotency-Key header to make retries safe: a repeated key replays the first response instead of creating again.",
 )
 def create_project(
-    project: ProjectCreate, service: ProjectService = Depends(get_project_service)
+    project: ProjectCreate,
+    service: ProjectService = Depends(get_project_service),
+    idempotency: IdempotentRequest = Depends(get_idempotent_request),
 ):
-    success, message = service.create_project(project.name, project.description)
-    if not success:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=message)
-    
-    created_project = service.project_repository.get_by_name(project.name)
-    return created_project
+    replayed = idempotency.replay(project)
+    if replayed is not None:
+        return replayed
+
+    result = service.create_project(project.name, project.description)
+    if not result.success:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=result.message
+        )
+
+    return idempotency.respond(
+        to_json(ProjectResponse.model_validate(result.entity)), status.HTTP_201_CREATED
+    )
 
 
 @router.get(
     "/",
-    response_model=List[ProjectResponse],
-    summary="List all projects",
-    description="Retrieve a list of all projects.",
+    response_model=Union[ProjectPage, ProjectWithTasksPage],
+    summary="List projects",
+    description="Retrieve a page of projects ordered by creation time. Pass next_cursor as cursor to fetch the following page. With include=tasks every project embeds its tasks, loaded with one extra query for the whole page.",
 )
-def list_projects(service: ProjectService = Depends(get_project_service)):
-    projects = service.get_all_projects()
-    return projects
+def list_projects(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    include: Optional[str] = Query(
+        None, pattern="^tasks$", description="Set to 'tasks' to embed each project's tasks"
+    ),
+    service: ProjectService = Depends(get_project_service),
+):
+    if include == "tasks":
+        # Checked before the page and its tasks are loaded
+        versions = service.get_projects_page_version(page.limit, page.after)
+        not_modified = check_conditional(
+            request, response, projects_with_tasks_etag(versions, page)
+        )
+        if not_modified is not None:
+            return not_modified
+
+        projects, has_more = service.get_projects_page_with_tasks(
+            PROJECT_COLUMNS, TASK_COLUMNS, page.limit, page.after
+        )
+        return projects_with_tasks_response(projects, has_more, response)
+
+    # A cheap count/max(id) query decides whether the page can be a 304
+    version = service.get_projects_version()
+    etag = make_etag("projects", version, page.limit, page.cursor)
+    not_modified = check_conditional(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    rows, has_more = service.get_projects_row_page(
+        PROJECT_COLUMNS, page.limit, page.after
+    )
+    return row_page_response(rows, next_cursor(rows, has_more), response)
+
+
+@router.get(
+    "/summary",
+    response_model=List[ProjectSummary],
+    summary="Summarize projects",
+    description="Per-project task counts by status, overdue open tasks and the next upcoming deadline, computed in a single grouped query.",
+)
+def get_projects_summary(service: ProjectService = Depends(get_project_service)):
+    return service.get_projects_summary()
 
 
 @router.get(
@@ -52,12 +145,24 @@ def list_projects(service: ProjectService = Depends(get_project_service)):
     summary="Get a project by ID",
     description="Retrieve a specific project by its ID.",
 )
-def get_project(project_id: int, service: ProjectService = Depends(get_project_service)):
-    try:
-        project = service.get_project_by_id(project_id)
-        return project
-    except EntityNotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+def get_project(
+    project_id: int,
+    request: Request,
+    response: Response,
+    service: ProjectService = Depends(get_project_service),
+):
+    project = service.get_project_by_id(project_id)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+    etag = version_etag(project.version)
+    not_modified = check_conditional(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    return project
 
 
 @router.delete(
@@ -67,8 +172,12 @@ def get_project(project_id: int, service: ProjectService = Depends(get_project_s
     description="Delete a project and all its associated tasks.",
 )
 def delete_project(
-    project_id: int, service: ProjectService = Depends(get_project_service)
+    project_id: int,
+    request: Request,
+    service: ProjectService = Depends(get_project_service),
 ):
-    success, message = service.delete_project(project_id)
-    if not success:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
+    result = service.delete_project(project_id, if_match_versions(request))
+    if not result.success:
+        raise HTTPException(
+            status_code=error_status_code(result.error), detail=result.message
+        )
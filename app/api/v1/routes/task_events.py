@@ -0,0 +1,113 @@
+import asyncio
+import os
+from typing import AsyncIterator
+
+from dotenv import load_dotenv
+from fastapi import APIRouter, HTTPException, Request, WebSocket, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+
+from app.db.session import SessionLocal
+from app.events import Event, get_broker, is_events_enabled
+from app.repositories.project_repository import ProjectRepository
+
+load_dotenv()
+
+router = APIRouter(prefix="/projects/{project_id}/tasks", tags=["Tasks"])
+
+
+def get_heartbeat_seconds() -> float:
+    return float(os.getenv("EVENTS_HEARTBEAT_SECONDS", 15))
+
+
+def _project_exists(project_id: int) -> bool:
+    # A short-lived session: feeds stay open for minutes and must not hold a
+    # pooled connection while they do
+    session = SessionLocal()
+    try:
+        # Uncached, so a project deleted by another worker is seen at once
+        return ProjectRepository(session).get_by_id(project_id) is not None
+    finally:
+        session.close()
+
+
+def _encode_sse(event: Event) -> bytes:
+    return b"event: " + event["type"].encode() + b"\ndata: " + to_json(event) + b"\n\n"
+
+
+async def stream_events(request: Request, project_id: int) -> AsyncIterator[bytes]:
+    heartbeat = get_heartbeat_seconds()
+    async with get_broker().subscribe(project_id) as queue:
+        yield b": connected\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                # Comment lines keep proxies from timing out idle connections
+                yield b": keep-alive\n\n"
+                continue
+            if event is None:
+                return
+            yield _encode_sse(event)
+
+
+@router.get(
+    "/events",
+    summary="Stream task changes in a project",
+    description="Server-sent events for tasks created, changed status or deleted in a project, so clients can apply deltas instead of re-polling the task list. A `resync` event means changes may have been missed and the list should be fetched again.",
+    response_class=StreamingResponse,
+)
+async def task_events(project_id: int, request: Request):
+    if not is_events_enabled():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Change feed is disabled",
+        )
+    if not await run_in_threadpool(_project_exists, project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+    return StreamingResponse(
+        stream_events(request, project_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _send_events(websocket: WebSocket, queue: asyncio.Queue) -> None:
+    while True:
+        event = await queue.get()
+        if event is None:
+            await websocket.close(code=status.WS_1001_GOING_AWAY)
+            return
+        await websocket.send_text(to_json(event).decode())
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    # The feed is one-way; reading is how a closed socket is noticed
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
+@router.websocket("/ws")
+async def task_events_websocket(websocket: WebSocket, project_id: int):
+    if not is_events_enabled() or not await run_in_threadpool(_project_exists, project_id):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    async with get_broker().subscribe(project_id) as queue:
+        tasks = {
+            asyncio.ensure_future(_send_events(websocket, queue)),
+            asyncio.ensure_future(_wait_for_disconnect(websocket)),
+        }
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            task.result()
@@ -0,0 +1,98 @@
+import io
+from typing import AsyncIterator, Optional
+
+from anyio import from_thread
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.api.v1.schemas import TaskImportReport
+from app.services.task_import import import_tasks, text_stream
+from app.services.results import ServiceError
+
+router = APIRouter(prefix="/projects/{project_id}/tasks", tags=["Tasks"])
+
+# Accepted Content-Type per format; a missing header is accepted as well
+IMPORT_MEDIA_TYPES = {
+    "ndjson": ("application/x-ndjson", "application/ndjson", "application/jsonl"),
+    "csv": ("text/csv",),
+}
+GENERIC_MEDIA_TYPES = ("text/plain", "application/octet-stream")
+
+
+class RequestBodyReader(io.RawIOBase):
+
+    # Hands the request body to the import thread chunk by chunk, so rows are
+    # parsed and committed while the upload is still arriving
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+        self._done = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer and not self._done:
+            chunk = from_thread.run(self._next_chunk)
+            if chunk is None:
+                self._done = True
+            else:
+                self._buffer = chunk
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    async def _next_chunk(self) -> Optional[bytes]:
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return None
+
+
+def check_media_type(request: Request, import_format: str) -> None:
+    content_type = request.headers.get("content-type")
+    if content_type is None:
+        return
+
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    accepted = IMPORT_MEDIA_TYPES[import_format] + GENERIC_MEDIA_TYPES
+    if media_type not in accepted:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Send the {import_format} file as the raw request body with Content-Type {', '.join(accepted)}",
+        )
+
+
+@router.post(
+    "/import",
+    response_model=TaskImportReport,
+    summary="Import tasks from a file",
+    description="Import tasks from an NDJSON or CSV request body (title, description and optional deadline per row), sent as the raw body rather than a multipart form. Rows are validated and inserted in chunks as the body arrives; invalid rows, rows that are not UTF-8 and rows over the per-project limit are reported without aborting the rest of the load.",
+)
+async def import_project_tasks(
+    project_id: int,
+    request: Request,
+    import_format: str = Query(
+        "ndjson",
+        alias="format",
+        pattern="^(ndjson|csv)$",
+        description="Input format",
+    ),
+):
+    check_media_type(request, import_format)
+
+    stream = text_stream(io.BufferedReader(RequestBodyReader(request.stream())))
+    with stream:
+        result = await run_in_threadpool(import_tasks, stream, project_id, import_format)
+
+    if not result.success:
+        raise HTTPException(
+            status_code=(
+                status.HTTP_404_NOT_FOUND
+                if result.error == ServiceError.NOT_FOUND
+                else status.HTTP_400_BAD_REQUEST
+            ),
+            detail=result.message,
+        )
+    return result.entity.as_dict()
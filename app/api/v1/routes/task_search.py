@@ -0,0 +1,47 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+
+from app.api.v1.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_rank_cursor,
+    encode_rank_cursor,
+)
+from app.api.v1.routes.tasks import TASK_COLUMNS, get_task_service
+from app.api.v1.schemas import TaskSearchPage
+from app.api.v1.serialization import row_page_response
+from app.services.task_service import TaskService
+
+router = APIRouter(prefix="/tasks", tags=["Tasks"])
+
+
+@router.get(
+    "/search",
+    response_model=TaskSearchPage,
+    summary="Search tasks",
+    description="Full-text search over task titles and descriptions, best match first. On PostgreSQL the query accepts web-search syntax (quoted phrases, OR, -term) and is served by a GIN index; other databases match every term with LIKE.",
+)
+def search_tasks(
+    response: Response,
+    q: str = Query(
+        ..., min_length=1, max_length=200, pattern=r"\S", description="Search text"
+    ),
+    project_id: Optional[int] = Query(None, description="Only tasks in this project"),
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of items to return",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor returned as next_cursor by a previous page"
+    ),
+    service: TaskService = Depends(get_task_service),
+):
+    after = decode_rank_cursor(cursor) if cursor else None
+    rows, has_more = service.search_tasks(TASK_COLUMNS, q, limit, after, project_id)
+    next_page = (
+        encode_rank_cursor(rows[-1].rank, rows[-1].id) if has_more and rows else None
+    )
+    return row_page_response(rows, next_page, response)
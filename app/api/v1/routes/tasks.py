@@ -1,68 +1,211 @@
-import re
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status, Depends
+from pydantic_core import to_json
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
-from app.api.v1.schemas import TaskCreate, TaskResponse, TaskUpdate, TaskStatusUpdate
+from app.api.v1.conditional import (
+    check_conditional,
+    if_match_versions,
+    make_etag,
+    version_etag,
+)
+from app.api.v1.idempotency import IdempotentRequest, get_idempotent_request
+from app.api.v1.pagination import PageParams, next_cursor
+from app.api.v1.schemas import (
+    TaskBulkCreate,
+    TaskBulkStatusUpdate,
+    TaskCreate,
+    TaskPage,
+    TaskResponse,
+    TaskStatusUpdate,
+    TaskUpdate,
+)
+from app.api.v1.serialization import response_columns, row_page_response
 from app.db.session import get_db
-from app.exceptions import EntityNotFoundException
-from app.repositories.project_repository import ProjectRepository
-from app.repositories.task_repository import TaskRepository
+from app.models.task import Task
+from app.repositories.cached import get_project_repository, get_task_repository
+from app.services.results import ServiceError
 from app.services.task_service import TaskService
 
 router = APIRouter(prefix="/projects/{project_id}/tasks", tags=["Tasks"])
 
+TASK_COLUMNS = response_columns(Task, TaskResponse)
+
 
 def get_task_service(db: Session = Depends(get_db)) -> TaskService:
-    task_repo = TaskRepository(db)
-    project_repo = ProjectRepository(db)
+    task_repo = get_task_repository(db)
+    project_repo = get_project_repository(db)
     return TaskService(task_repo, project_repo)
 
 
+def ensure_project_task(task: Optional[Task], project_id: int) -> Task:
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
+    if task.project_id != project_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found in this project",
+        )
+    return task
+
+
+def get_project_task(project_id: int, task_id: int, service: TaskService):
+    return ensure_project_task(service.task_repository.get_by_id(task_id), project_id)
+
+
+def error_status_code(error: ServiceError) -> int:
+    if error == ServiceError.NOT_FOUND:
+        return status.HTTP_404_NOT_FOUND
+    if error == ServiceError.PRECONDITION_FAILED:
+        return status.HTTP_412_PRECONDITION_FAILED
+    if error == ServiceError.CONFLICT:
+        return status.HTTP_409_CONFLICT
+    return status.HTTP_400_BAD_REQUEST
+
+
+def check_task_list(
+    request: Request,
+    response: Response,
+    version: Optional[Row],
+    project_id: int,
+    page: PageParams,
+    status_filter: Optional[str],
+    deadline_from: Optional[datetime],
+    deadline_to: Optional[datetime],
+) -> Optional[Response]:
+    # Every task write bumps the project revision, so the project row alone
+    # decides whether the page can be a 304
+    if version is None:
+        return None
+
+    etag = make_etag(
+        "tasks",
+        project_id,
+        version.revision,
+        page.limit,
+        page.cursor,
+        status_filter,
+        deadline_from,
+        deadline_to,
+    )
+    last_modified = version.updated_at or version.created_at
+    return check_conditional(request, response, etag, last_modified)
+
+
 @router.post(
     "/",
     response_model=TaskResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new task",
-    description="Create a new task in a project. Maximum 100 tasks per project allowed.",
+    description="Create a new task in a project. Maximum 100 tasks per project allowed. Send an Idempotency-Key header to make retries safe: a repeated key replays the first response instead of creating again.",
 )
 def create_task(
     project_id: int,
     task: TaskCreate,
     service: TaskService = Depends(get_task_service),
+    idempotency: IdempotentRequest = Depends(get_idempotent_request),
 ):
-    success, message = service.add_task(
-        project_id, task.title, task.description, task.deadline
+    replayed = idempotency.replay(task)
+    if replayed is not None:
+        return replayed
+
+    result = service.add_task(project_id, task.title, task.description, task.deadline)
+    if not result.success:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=result.message
+        )
+
+    return idempotency.respond(
+        to_json(TaskResponse.model_validate(result.entity)), status.HTTP_201_CREATED
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=List[TaskResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create tasks in bulk",
+    description="Create many tasks in a project with a single INSERT. The per-project task limit applies to the whole batch. Send an Idempotency-Key header to make retries safe: a repeated key replays the first response instead of creating again.",
+)
+def create_tasks_bulk(
+    project_id: int,
+    payload: TaskBulkCreate,
+    service: TaskService = Depends(get_task_service),
+    idempotency: IdempotentRequest = Depends(get_idempotent_request),
+):
+    replayed = idempotency.replay(payload)
+    if replayed is not None:
+        return replayed
+
+    result = service.add_tasks(
+        project_id, [task.model_dump() for task in payload.tasks]
+    )
+    if not result.success:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=result.message
+        )
+
+    return idempotency.respond(
+        to_json([TaskResponse.model_validate(task) for task in result.entity]),
+        status.HTTP_201_CREATED,
     )
-    if not success:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=message)
-    
-    match = re.search(r'\(ID: (\d+)\)', message)
-    if match:
-        task_id = int(match.group(1))
-        created_task = service.task_repository.get_by_id(task_id)
-        return created_task
-    
-    tasks = service.get_tasks_by_project(project_id)
-    created_task = tasks[-1] if tasks else None
-    return created_task
 
 
 @router.get(
     "/",
-    response_model=List[TaskResponse],
-    summary="List all tasks in a project",
-    description="Retrieve all tasks for a specific project.",
+    response_model=TaskPage,
+    summary="List tasks in a project",
+    description="Retrieve a page of tasks for a specific project ordered by creation time, optionally filtered by status and deadline range.",
 )
 def list_tasks(
-    project_id: int, service: TaskService = Depends(get_task_service)
+    project_id: int,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    status_filter: Optional[str] = Query(
+        None,
+        alias="status",
+        pattern="^(todo|doing|done)$",
+        description="Only tasks with this status",
+    ),
+    deadline_from: Optional[datetime] = Query(
+        None, description="Only tasks with a deadline at or after this time"
+    ),
+    deadline_to: Optional[datetime] = Query(
+        None, description="Only tasks with a deadline at or before this time"
+    ),
+    service: TaskService = Depends(get_task_service),
 ):
-    try:
-        tasks = service.get_tasks_by_project(project_id)
-        return tasks
-    except EntityNotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    version = service.get_tasks_version(project_id)
+    not_modified = check_task_list(
+        request,
+        response,
+        version,
+        project_id,
+        page,
+        status_filter,
+        deadline_from,
+        deadline_to,
+    )
+    if not_modified is not None:
+        return not_modified
+
+    rows, has_more = service.get_tasks_row_page(
+        TASK_COLUMNS,
+        project_id,
+        page.limit,
+        page.after,
+        status_filter,
+        deadline_from,
+        deadline_to,
+    )
+    return row_page_response(rows, next_cursor(rows, has_more), response)
 
 
 @router.get(
@@ -72,80 +215,83 @@ def list_tasks(
     description="Retrieve a specific task by its ID.",
 )
 def get_task(
-    project_id: int, task_id: int, service: TaskService = Depends(get_task_service)
+    project_id: int,
+    task_id: int,
+    request: Request,
+    response: Response,
+    service: TaskService = Depends(get_task_service),
+):
+    task = get_project_task(project_id, task_id, service)
+
+    etag = version_etag(task.version)
+    not_modified = check_conditional(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    return task
+
+
+@router.patch(
+    "/status",
+    response_model=List[TaskResponse],
+    summary="Update the status of many tasks",
+    description="Apply a list of (task_id, status) changes in one request, with one UPDATE per target status. All tasks must belong to the project or nothing is changed. Returns the tasks whose status changed.",
+)
+def update_task_statuses(
+    project_id: int,
+    payload: TaskBulkStatusUpdate,
+    service: TaskService = Depends(get_task_service),
 ):
-    try:
-        task = service.task_repository.get_by_id(task_id)
-        if not task:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task not found",
-            )
-        if task.project_id != project_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task not found in this project",
-            )
-        return task
-    except EntityNotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    result = service.change_task_statuses(
+        project_id, [(change.task_id, change.status) for change in payload.updates]
+    )
+    if not result.success:
+        raise HTTPException(
+            status_code=error_status_code(result.error), detail=result.message
+        )
+
+    return [dict(row) for row in result.entity]
 
 
 @router.patch(
     "/{task_id}/status",
     response_model=TaskResponse,
     summary="Update task status",
-    description="Update the status of a task (todo, doing, done).",
+    description="Update the status of a task (todo, doing, done). Send the task's ETag in If-Match to only apply the change if the task is unchanged (412 otherwise); a write that races another one is rejected with 409.",
 )
 def update_task_status(
     project_id: int,
     task_id: int,
     status_update: TaskStatusUpdate,
+    request: Request,
+    response: Response,
     service: TaskService = Depends(get_task_service),
 ):
-    task = service.task_repository.get_by_id(task_id)
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found",
-        )
-    
-    if task.project_id != project_id:
+    result = service.change_task_status(
+        task_id, status_update.status, project_id, if_match_versions(request)
+    )
+    if not result.success:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found in this project",
+            status_code=error_status_code(result.error), detail=result.message
         )
-    
-    success, result = service.change_task_status(task_id, status_update.status)
-    if not success:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result)
-    
-    updated_task = service.task_repository.get_by_id(task_id)
-    return updated_task
+
+    response.headers["ETag"] = version_etag(result.entity.version)
+    return result.entity
 
 
 @router.delete(
     "/{task_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a task",
-    description="Delete a specific task.",
+    description="Delete a specific task. Honours If-Match like the status update.",
 )
 def delete_task(
-    project_id: int, task_id: int, service: TaskService = Depends(get_task_service)
+    project_id: int,
+    task_id: int,
+    request: Request,
+    service: TaskService = Depends(get_task_service),
 ):
-    task = service.task_repository.get_by_id(task_id)
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found",
-        )
-    
-    if task.project_id != project_id:
+    result = service.delete_task(task_id, project_id, if_match_versions(request))
+    if not result.success:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found in this project",
+            status_code=error_status_code(result.error), detail=result.message
         )
-    
-    success, message = service.delete_task(task_id)
-    if not success:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
@@ -1,21 +1,45 @@
 from app.api.v1.schemas.project import (
     ProjectCreate,
+    ProjectPage,
     ProjectResponse,
+    ProjectSummary,
     ProjectUpdate,
+    ProjectWithTasks,
+    ProjectWithTasksPage,
 )
 from app.api.v1.schemas.task import (
+    TaskBulkCreate,
+    TaskBulkStatusUpdate,
     TaskCreate,
+    TaskImportError,
+    TaskImportReport,
+    TaskPage,
     TaskResponse,
+    TaskSearchPage,
+    TaskSearchResult,
     TaskUpdate,
+    TaskStatusChange,
     TaskStatusUpdate,
 )
 
 __all__ = [
     "ProjectCreate",
+    "ProjectPage",
     "ProjectResponse",
+    "ProjectSummary",
     "ProjectUpdate",
+    "ProjectWithTasks",
+    "ProjectWithTasksPage",
+    "TaskBulkCreate",
+    "TaskBulkStatusUpdate",
     "TaskCreate",
+    "TaskImportError",
+    "TaskImportReport",
+    "TaskPage",
     "TaskResponse",
+    "TaskSearchPage",
+    "TaskSearchResult",
     "TaskUpdate",
+    "TaskStatusChange",
     "TaskStatusUpdate",
 ]
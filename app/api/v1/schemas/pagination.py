@@ -0,0 +1,10 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class PageBase(BaseModel):
+
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, or null on the last page"
+    )
@@ -1,8 +1,11 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from app.api.v1.schemas.pagination import PageBase
+from app.api.v1.schemas.task import TaskResponse
+
 
 class ProjectBase(BaseModel):
 
@@ -47,5 +50,52 @@ class ProjectResponse(ProjectBase):
 
     id: int = Field(..., description="Project ID")
     created_at: datetime = Field(..., description="Project creation timestamp")
+    version: int = Field(..., description="Row version; also sent as the ETag")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectSummary(BaseModel):
+
+    id: int = Field(..., description="Project ID")
+    name: str = Field(..., description="Project name")
+    total: int = Field(..., description="Number of tasks in the project")
+    status_counts: Dict[str, int] = Field(
+        ..., description="Number of tasks per status (todo, doing, done)"
+    )
+    overdue: int = Field(
+        ..., description="Open tasks whose deadline has already passed"
+    )
+    next_deadline: Optional[datetime] = Field(
+        None, description="Earliest upcoming deadline among open tasks"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id": 1,
+                "name": "My Project",
+                "total": 5,
+                "status_counts": {"todo": 2, "doing": 1, "done": 2},
+                "overdue": 1,
+                "next_deadline": "2025-12-31T23:59:59",
+            }
+        }
+    )
+
+
+class ProjectWithTasks(ProjectResponse):
+
+    tasks: List[TaskResponse] = Field(..., description="Tasks in the project")
+
+
+class ProjectPage(PageBase):
+
+    items: List[ProjectResponse] = Field(..., description="Projects in this page")
+
+
+class ProjectWithTasksPage(PageBase):
+
+    items: List[ProjectWithTasks] = Field(
+        ..., description="Projects in this page, each with its tasks"
+    )
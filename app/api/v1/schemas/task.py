@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from app.api.v1.schemas.pagination import PageBase
+
 
 class TaskBase(BaseModel):
 
@@ -29,6 +31,28 @@ class TaskCreate(TaskBase):
     )
 
 
+class TaskBulkCreate(BaseModel):
+
+    tasks: List[TaskCreate] = Field(
+        ..., min_length=1, max_length=5000, description="Tasks to create"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "tasks": [
+                    {"title": "Write docs", "description": "Document the bulk API"},
+                    {
+                        "title": "Release",
+                        "description": "Tag and publish the release",
+                        "deadline": "2025-12-31T23:59:59",
+                    },
+                ]
+            }
+        }
+    )
+
+
 class TaskUpdate(BaseModel):
 
     title: Optional[str] = Field(
@@ -63,6 +87,33 @@ class TaskStatusUpdate(BaseModel):
     )
 
 
+class TaskStatusChange(BaseModel):
+
+    task_id: int = Field(..., description="Task ID")
+    status: str = Field(
+        ..., pattern="^(todo|doing|done)$", description="New task status"
+    )
+
+
+class TaskBulkStatusUpdate(BaseModel):
+
+    updates: List[TaskStatusChange] = Field(
+        ..., min_length=1, max_length=5000, description="Status changes to apply"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "updates": [
+                    {"task_id": 1, "status": "doing"},
+                    {"task_id": 2, "status": "doing"},
+                    {"task_id": 3, "status": "done"},
+                ]
+            }
+        }
+    )
+
+
 class TaskResponse(TaskBase):
 
     id: int = Field(..., description="Task ID")
@@ -71,5 +122,38 @@ class TaskResponse(TaskBase):
     deadline: Optional[datetime] = Field(None, description="Task deadline")
     closed_at: Optional[datetime] = Field(None, description="Task close timestamp")
     created_at: datetime = Field(..., description="Task creation timestamp")
+    version: int = Field(..., description="Row version; also sent as the ETag")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TaskImportError(BaseModel):
+
+    row: int = Field(..., description="Row number in the uploaded file")
+    error: str = Field(..., description="Why the row was rejected")
+
+
+class TaskImportReport(BaseModel):
+
+    imported: int = Field(..., description="Number of tasks created")
+    failed: int = Field(..., description="Number of rows rejected")
+    errors: List[TaskImportError] = Field(
+        ..., description="Rejected rows (capped at IMPORT_MAX_ERRORS entries)"
+    )
+
+
+class TaskPage(PageBase):
+
+    items: List[TaskResponse] = Field(..., description="Tasks in this page")
+
+
+class TaskSearchResult(TaskResponse):
+
+    rank: float = Field(..., description="Relevance score; higher is better")
+
+
+class TaskSearchPage(PageBase):
+
+    items: List[TaskSearchResult] = Field(
+        ..., description="Matching tasks in this page, best match first"
+    )
@@ -0,0 +1,43 @@
+from typing import Any, List, Optional, Sequence, Type
+
+from fastapi import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+from sqlalchemy import Row
+
+from app.db.base import Base
+
+
+class PydanticJSONResponse(Response):
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        # pydantic-core's serializer: datetimes and the like come out exactly as
+        # they would from the response model, without building model instances
+        return to_json(content)
+
+
+def response_columns(model: Type[Base], schema: Type[BaseModel]) -> List[Any]:
+    # The ORM columns backing each field of a response schema
+    return [getattr(model, name) for name in schema.model_fields]
+
+
+def model_response(content: BaseModel, response: Response) -> Response:
+    return Response(
+        content.model_dump_json(),
+        media_type="application/json",
+        headers=dict(response.headers),
+    )
+
+
+def row_page_response(
+    rows: Sequence[Row], cursor: Optional[str], response: Response
+) -> Response:
+    # Rows were selected with exactly the response fields, so they are written
+    # out as-is instead of going through ORM objects and response_model
+    # validation. Headers set on the injected response (ETag etc.) carry over.
+    return PydanticJSONResponse(
+        {"items": [row._asdict() for row in rows], "next_cursor": cursor},
+        headers=dict(response.headers),
+    )
@@ -0,0 +1,43 @@
+import os
+from functools import lru_cache
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from app.cache.backends import (
+    CacheBackend,
+    CacheStats,
+    InMemorySharedCacheBackend,
+    LRUCacheBackend,
+    RedisCacheBackend,
+)
+
+load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def get_cache() -> Optional[CacheBackend]:
+    backend = os.getenv("CACHE_BACKEND", "none").lower()
+    ttl = float(os.getenv("CACHE_TTL_SECONDS", 30))
+
+    if backend == "memory":
+        return LRUCacheBackend(ttl, int(os.getenv("CACHE_MAX_ENTRIES", 10000)))
+    if backend == "shared-memory":
+        return InMemorySharedCacheBackend(ttl)
+    if backend == "redis":
+        return RedisCacheBackend(
+            ttl, os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+        )
+    if backend != "none":
+        raise ValueError(f"Unknown CACHE_BACKEND '{backend}'.")
+    return None
+
+
+@lru_cache(maxsize=1)
+def get_idempotency_cache() -> LRUCacheBackend:
+    # Per-process front for stored Idempotency-Key responses; the
+    # idempotency_keys table stays the source of truth across workers
+    return LRUCacheBackend(
+        float(os.getenv("IDEMPOTENCY_TTL_SECONDS", 86400)),
+        int(os.getenv("IDEMPOTENCY_CACHE_MAX_ENTRIES", 10000)),
+    )
@@ -0,0 +1,194 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+CacheValue = Dict[str, Any]
+
+
+class CacheStats:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.invalidations = 0
+
+    def record(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def as_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "sets": self.sets,
+                "invalidations": self.invalidations,
+            }
+
+
+class CacheBackend:
+
+    name = "base"
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[CacheValue]:
+        value = self._get(key)
+        self.stats.record("hits" if value is not None else "misses")
+        return value
+
+    def set(self, key: str, value: CacheValue) -> None:
+        self._set(key, value)
+        self.stats.record("sets")
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self._delete(keys)
+            self.stats.record("invalidations", len(keys))
+
+    def _get(self, key: str) -> Optional[CacheValue]:
+        raise NotImplementedError
+
+    def _set(self, key: str, value: CacheValue) -> None:
+        raise NotImplementedError
+
+    def _delete(self, keys: Tuple[str, ...]) -> None:
+        raise NotImplementedError
+
+
+class LRUCacheBackend(CacheBackend):
+
+    name = "memory"
+
+    def __init__(self, ttl: float, max_entries: int):
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, CacheValue]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[CacheValue]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(value)
+
+    def _set(self, key: str, value: CacheValue) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, dict(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _delete(self, keys: Tuple[str, ...]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+
+def _encode(value: CacheValue) -> str:
+    # Shared stores hold strings, so tag datetimes to restore them on read
+    return json.dumps(
+        {
+            field: {"$dt": item.isoformat()} if isinstance(item, datetime) else item
+            for field, item in value.items()
+        }
+    )
+
+
+def _decode(raw: str) -> CacheValue:
+    return {
+        field: (
+            datetime.fromisoformat(item["$dt"])
+            if isinstance(item, dict) and "$dt" in item
+            else item
+        )
+        for field, item in json.loads(raw).items()
+    }
+
+
+class SharedCacheBackend(CacheBackend):
+
+    # Values cross process boundaries as encoded strings
+
+    def _get(self, key: str) -> Optional[CacheValue]:
+        raw = self._get_raw(key)
+        return _decode(raw) if raw is not None else None
+
+    def _set(self, key: str, value: CacheValue) -> None:
+        self._set_raw(key, _encode(value))
+
+    def _get_raw(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def _set_raw(self, key: str, raw: str) -> None:
+        raise NotImplementedError
+
+
+class InMemorySharedCacheBackend(SharedCacheBackend):
+
+    # Local stand-in for a shared store (development and benchmarks): same
+    # encoding and TTL semantics, one store per process.
+
+    name = "shared-memory"
+
+    def __init__(self, ttl: float):
+        super().__init__(ttl)
+        self._store: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def _get_raw(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            expires_at, raw = entry
+            if expires_at < time.monotonic():
+                del self._store[key]
+                return None
+            return raw
+
+    def _set_raw(self, key: str, raw: str) -> None:
+        with self._lock:
+            self._store[key] = (time.monotonic() + self.ttl, raw)
+
+    def _delete(self, keys: Tuple[str, ...]) -> None:
+        with self._lock:
+            for key in keys:
+                self._store.pop(key, None)
+
+
+class RedisCacheBackend(SharedCacheBackend):
+
+    name = "redis"
+
+    def __init__(self, ttl: float, url: str):
+        super().__init__(ttl)
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "CACHE_BACKEND=redis requires the 'redis' package."
+            ) from e
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+
+    def _get_raw(self, key: str) -> Optional[str]:
+        return self._client.get(key)
+
+    def _set_raw(self, key: str, raw: str) -> None:
+        self._client.set(key, raw, px=int(self.ttl * 1000))
+
+    def _delete(self, keys: Tuple[str, ...]) -> None:
+        self._client.delete(*keys)
@@ -1 +1,2 @@
 from app.commands.autoclose_overdue import autoclose_overdue_command
+from app.commands.purge_idempotency_keys import purge_idempotency_keys_command
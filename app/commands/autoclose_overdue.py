@@ -1,20 +1,37 @@
+import os
 from datetime import datetime
 
+from dotenv import load_dotenv
+
 from app.db.session import SessionLocal
-from app.repositories.project_repository import ProjectRepository
-from app.repositories.task_repository import TaskRepository
+from app.repositories.cached import get_project_repository, get_task_repository
 from app.services.task_service import TaskService
 
+load_dotenv()
+
 
 def autoclose_overdue_command() -> int:
+    batch_size = int(os.getenv("AUTOCLOSE_BATCH_SIZE", 1000))
+    if batch_size < 1:
+        # 0 would never finish a batch; negatives mean no LIMIT on some backends
+        raise ValueError(f"AUTOCLOSE_BATCH_SIZE must be at least 1, got {batch_size}.")
+
     session = SessionLocal()
     try:
-        project_repository = ProjectRepository(session)
-        task_repository = TaskRepository(session)
+        project_repository = get_project_repository(session)
+        task_repository = get_task_repository(session)
         task_service = TaskService(task_repository, project_repository)
 
-        closed_count = task_service.close_overdue_tasks()
-        session.commit()
+        # Close in short batches with a fixed cut-off so memory and lock time
+        # stay bounded however large the backlog is
+        now = datetime.now()
+        closed_count = 0
+        while True:
+            closed_ids = task_service.close_overdue_batch(now, batch_size)
+            session.commit()
+            closed_count += len(closed_ids)
+            if len(closed_ids) < batch_size:
+                break
 
         if closed_count > 0:
             print(
@@ -0,0 +1,112 @@
+import sys
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+from sqlalchemy import event
+
+from app.db.session import SessionLocal
+from app.models.task import Task
+from app.repositories.task_repository import TaskRepository, overdue_ids_query
+
+# (label, repository call, index its plan is expected to use)
+CHECKED_QUERIES: List[Tuple[str, Callable[[TaskRepository], object], str]] = [
+    (
+        "get_by_project_id",
+        lambda repo: repo.get_by_project_id(1),
+        "ix_tasks_project_id_created_at_id",
+    ),
+    (
+        "get_page_by_project_id",
+        lambda repo: repo.get_page_by_project_id(1, 100, (datetime.now(), 0)),
+        "ix_tasks_project_id_created_at_id",
+    ),
+    (
+        "count_by_project_id",
+        lambda repo: repo.count_by_project_id(1),
+        "ix_tasks_project_id_created_at_id",
+    ),
+    (
+        "close_overdue_batch (overdue ids)",
+        lambda repo: repo.session.execute(overdue_ids_query(datetime.now(), 1000)),
+        "ix_tasks_open_deadline",
+    ),
+    (
+        "get_open_deadlines (scheduler window)",
+        lambda repo: repo.get_open_deadlines(limit=1000, deadline_from=datetime.now()),
+        "ix_tasks_open_deadline",
+    ),
+    (
+        "get_open_deadlines (scheduler refresh)",
+        lambda repo: repo.get_open_deadlines(
+            deadline_to=datetime.now(), changed_since=datetime.now()
+        ),
+        "ix_tasks_open_deadline",
+    ),
+]
+
+# Only created on PostgreSQL; other backends search with LIKE
+POSTGRESQL_QUERIES: List[Tuple[str, Callable[[TaskRepository], object], str]] = [
+    (
+        "search",
+        lambda repo: repo.search([Task.id], "deadline", 100),
+        "ix_tasks_search",
+    ),
+]
+
+
+def _explain_prefix(dialect_name: str) -> str:
+    if dialect_name == "sqlite":
+        return "EXPLAIN QUERY PLAN "
+    return "EXPLAIN "
+
+
+def check_query_plans_command() -> int:
+    session = SessionLocal()
+    try:
+        connection = session.connection()
+        dialect_name = connection.dialect.name
+        if dialect_name == "postgresql":
+            # Tiny tables favour seq scans; we only care whether the index is usable
+            connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+
+        task_repository = TaskRepository(session)
+        failures = 0
+        checked = CHECKED_QUERIES
+        if dialect_name == "postgresql":
+            checked = CHECKED_QUERIES + POSTGRESQL_QUERIES
+        for label, run_query, index_name in checked:
+            captured = []
+
+            def capture(conn, cursor, statement, parameters, context, executemany):
+                captured.append((statement, parameters))
+
+            event.listen(connection, "before_cursor_execute", capture)
+            try:
+                run_query(task_repository)
+            finally:
+                event.remove(connection, "before_cursor_execute", capture)
+
+            statement, parameters = captured[-1]
+            rows = connection.exec_driver_sql(
+                _explain_prefix(dialect_name) + statement, parameters
+            ).all()
+            plan = "\n".join(" ".join(str(col) for col in row) for row in rows)
+
+            if index_name in plan:
+                print(f"[OK]   {label}: uses {index_name}")
+            else:
+                failures += 1
+                print(f"[FAIL] {label}: expected {index_name}, plan was:\n{plan}")
+
+        return 1 if failures else 0
+    finally:
+        session.rollback()
+        session.close()
+
+
+def main() -> None:
+    sys.exit(check_query_plans_command())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import argparse
+import sys
+from datetime import datetime
+from typing import List, Optional
+
+from app.services.task_import import IMPORT_FORMATS, import_tasks, text_stream
+
+
+def import_tasks_command(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="todolist-import",
+        description="Import tasks into a project from an NDJSON or CSV file.",
+    )
+    parser.add_argument("project_id", type=int, help="Project to import into")
+    parser.add_argument("path", help="File to import, or - for standard input")
+    parser.add_argument(
+        "--format",
+        dest="import_format",
+        choices=IMPORT_FORMATS,
+        help="Input format (default: from the file extension, else ndjson)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, help="Rows per insert/commit (IMPORT_CHUNK_SIZE)"
+    )
+    args = parser.parse_args(argv)
+
+    import_format = args.import_format
+    if import_format is None:
+        import_format = "csv" if args.path.lower().endswith(".csv") else "ndjson"
+
+    if args.path == "-":
+        stream = text_stream(sys.stdin.buffer)
+        result = import_tasks(stream, args.project_id, import_format, args.chunk_size)
+    else:
+        with text_stream(open(args.path, "rb")) as stream:
+            result = import_tasks(stream, args.project_id, import_format, args.chunk_size)
+
+    print(f"[{datetime.now().isoformat()}] {result.message}")
+    if not result.success:
+        return 1
+
+    report = result.entity
+    for error in report.errors:
+        print(f"  row {error['row']}: {error['error']}")
+    if report.failed > len(report.errors):
+        print(f"  ... {report.failed - len(report.errors)} more rejected row(s)")
+    return 0
+
+
+def main() -> None:
+    sys.exit(import_tasks_command())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from app.db.session import SessionLocal
+from app.repositories.idempotency_repository import IdempotencyRepository
+
+
+def purge_idempotency_keys_command() -> int:
+    session = SessionLocal()
+    try:
+        purged_count = IdempotencyRepository(session).delete_expired(datetime.now())
+        session.commit()
+
+        if purged_count > 0:
+            print(
+                f"[{datetime.now().isoformat()}] Purged {purged_count} expired idempotency key(s)."
+            )
+        return purged_count
+    except Exception as e:
+        session.rollback()
+        print(f"[{datetime.now().isoformat()}] Error: {e}")
+        raise
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    purge_idempotency_keys_command()
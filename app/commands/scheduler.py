@@ -1,25 +1,231 @@
+import asyncio
+import heapq
+import os
+import sys
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import List, Optional, Set, Tuple
 
-import schedule
+from dotenv import load_dotenv
 
 from app.commands.autoclose_overdue import autoclose_overdue_command
+from app.commands.purge_idempotency_keys import purge_idempotency_keys_command
+from app.db.session import SessionLocal
+from app.events import attach_scheduler
+from app.repositories.task_repository import TaskRepository
 
+load_dotenv()
 
-def setup_scheduler() -> None:
-    schedule.every(15).minutes.do(autoclose_overdue_command)
+# Small margin so we wake once `deadline < now` holds for the autoclose query
+WAKE_MARGIN_SECONDS = 0.001
+# Re-scan this far behind the last load to catch rows committed after it ran
+WATERMARK_LAG = timedelta(seconds=60)
 
-def run_scheduler() -> None:
-    setup_scheduler()
 
+class DeadlineScheduler:
+
+    def __init__(
+        self,
+        refresh_interval: Optional[float] = None,
+        window_size: Optional[int] = None,
+    ):
+        self.refresh_interval = (
+            refresh_interval
+            if refresh_interval is not None
+            else float(os.getenv("SCHEDULER_REFRESH_SECONDS", 300))
+        )
+        self.window_size = (
+            window_size
+            if window_size is not None
+            else int(os.getenv("SCHEDULER_WINDOW_SIZE", 1000))
+        )
+        # Min-heap of (deadline, task_id) for open tasks up to self._horizon
+        self._heap: List[Tuple[datetime, int]] = []
+        self._queued: Set[int] = set()
+        # Latest deadline loaded; None means every open deadline is in the heap
+        self._horizon: Optional[datetime] = None
+        # Tasks written at or after this instant have not been loaded yet
+        self._watermark: Optional[datetime] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._refresh_requested = False
+        self._stopped = False
+
+    def notify(
+        self, deadlines: List[Tuple[int, datetime]], refresh: bool = False
+    ) -> None:
+        # Thread-safe: called after commit with the deadlines just written, so
+        # they are scheduled without waiting for the next refresh
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._push_and_wake, deadlines, refresh)
+
+    def stop(self) -> None:
+        self._stopped = True
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wake)
+
+    async def run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        attach_scheduler(self)
+        try:
+            next_refresh = time.monotonic()
+            while not self._stopped:
+                try:
+                    next_refresh = await self._step(next_refresh)
+                except Exception as e:
+                    print(
+                        f"[{datetime.now().isoformat()}] Scheduler error: {e}",
+                        file=sys.stderr,
+                    )
+                    # Start over with a full catch-up once the back-off has passed
+                    self._reset()
+                    next_refresh = time.monotonic() + self.refresh_interval
+
+                if not self._stopped:
+                    await self._sleep(next_refresh)
+        finally:
+            attach_scheduler(None)
+
+    async def _step(self, next_refresh: float) -> float:
+        if self._watermark is None:
+            # Catch up on anything that went overdue while we were not running
+            await asyncio.to_thread(autoclose_overdue_command)
+            await self._load_window()
+            return time.monotonic() + self.refresh_interval
+
+        if self._pop_due(datetime.now()):
+            await asyncio.to_thread(autoclose_overdue_command)
+
+        if time.monotonic() >= next_refresh or self._refresh_requested:
+            self._refresh_requested = False
+            await self._refresh()
+            await self._purge_idempotency_keys()
+            return time.monotonic() + self.refresh_interval
+        if not self._heap and self._horizon is not None:
+            # Window drained but more deadlines exist beyond it
+            await self._load_window()
+        return next_refresh
+
+    @staticmethod
+    async def _purge_idempotency_keys() -> None:
+        # Housekeeping only (expired keys are already ignored on read), so a
+        # failure is logged and never stops deadline handling
+        try:
+            await asyncio.to_thread(purge_idempotency_keys_command)
+        except Exception as e:
+            print(
+                f"[{datetime.now().isoformat()}] Idempotency key purge failed: {e}",
+                file=sys.stderr,
+            )
+
+    def _reset(self) -> None:
+        self._heap = []
+        self._queued = set()
+        self._horizon = None
+        self._watermark = None
+        self._refresh_requested = False
+
+    async def _sleep(self, next_refresh: float) -> None:
+        if self._refresh_requested:
+            return
+        timeout = next_refresh - time.monotonic()
+        if self._heap:
+            until_due = (self._heap[0][0] - datetime.now()).total_seconds()
+            timeout = min(timeout, until_due + WAKE_MARGIN_SECONDS)
+        if timeout <= 0:
+            return
+
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _push(self, deadline: datetime, task_id: int) -> None:
+        if task_id in self._queued:
+            return
+        if self._horizon is not None and deadline > self._horizon:
+            return  # Picked up when the window moves past the horizon
+        self._queued.add(task_id)
+        heapq.heappush(self._heap, (deadline, task_id))
+
+    def _push_and_wake(
+        self, deadlines: List[Tuple[int, datetime]], refresh: bool
+    ) -> None:
+        for task_id, deadline in deadlines:
+            self._push(deadline, task_id)
+        if refresh:
+            self._refresh_requested = True
+        self._wake()
+
+    def _pop_due(self, now: datetime) -> int:
+        due = 0
+        while self._heap and self._heap[0][0] < now:
+            _, task_id = heapq.heappop(self._heap)
+            self._queued.discard(task_id)
+            due += 1
+        return due
+
+    async def _load_window(self) -> None:
+        now = datetime.now()
+        deadlines = await asyncio.to_thread(
+            self._fetch_deadlines, limit=self.window_size, deadline_from=now
+        )
+        horizon = deadlines[-1][0] if len(deadlines) >= self.window_size else None
+
+        # Keep entries notified while the query ran
+        entries = {task_id: deadline for deadline, task_id in self._heap}
+        entries.update({task_id: deadline for deadline, task_id in deadlines})
+        self._heap = [
+            (deadline, task_id)
+            for task_id, deadline in entries.items()
+            if horizon is None or deadline <= horizon
+        ]
+        heapq.heapify(self._heap)
+        self._queued = {task_id for _, task_id in self._heap}
+        self._horizon = horizon
+        self._watermark = now - WATERMARK_LAG
+
+    async def _refresh(self) -> None:
+        # Incremental: only tasks created, reopened or imported since the last
+        # load, within the window
+        watermark = datetime.now() - WATERMARK_LAG
+        deadlines = await asyncio.to_thread(
+            self._fetch_deadlines,
+            deadline_to=self._horizon,
+            changed_since=self._watermark,
+        )
+        for deadline, task_id in deadlines:
+            self._push(deadline, task_id)
+        self._watermark = watermark
+
+    @staticmethod
+    def _fetch_deadlines(**filters) -> List[Tuple[datetime, int]]:
+        session = SessionLocal()
+        try:
+            return TaskRepository(session).get_open_deadlines(**filters)
+        finally:
+            session.close()
+
+
+def is_embedded_scheduler_enabled() -> bool:
+    return os.getenv("SCHEDULER_EMBEDDED", "false").lower() in ("1", "true", "yes")
+
+
+def run_scheduler() -> None:
     print(f"[{datetime.now().isoformat()}] Scheduler started.")
     print("Press Ctrl+C to stop.")
 
-    autoclose_overdue_command()
-
-    while True:
-        schedule.run_pending()
-        time.sleep(60)
+    try:
+        asyncio.run(DeadlineScheduler().run())
+    except KeyboardInterrupt:
+        print(f"[{datetime.now().isoformat()}] Scheduler stopped.")
 
 
 if __name__ == "__main__":
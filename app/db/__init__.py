@@ -1,2 +1,11 @@
 from app.db.base import Base
-from app.db.session import get_engine, get_session, SessionLocal
+from app.db.session import (
+    get_engine,
+    get_session,
+    SessionLocal,
+    dispose_engine,
+    get_pool_status,
+    get_async_engine,
+    get_async_session,
+    get_async_sessionmaker,
+)
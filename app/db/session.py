@@ -1,13 +1,32 @@
 import os
-from typing import Generator
+import threading
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 load_dotenv()
 
+# Async drivers used when DATABASE_ASYNC_URL is not set explicitly
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+_async_sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None
+_engine_lock = threading.Lock()
+
 
 def get_database_url() -> str:
     return os.getenv(
@@ -16,12 +35,136 @@ def get_database_url() -> str:
     )
 
 
+def get_async_database_url() -> str:
+    async_url = os.getenv("DATABASE_ASYNC_URL")
+    if async_url:
+        return async_url
+
+    url = make_url(get_database_url())
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(
+            f"No async driver configured for '{backend}'. Set DATABASE_ASYNC_URL."
+        )
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(
+        hide_password=False
+    )
+
+
+def is_async_database_enabled() -> bool:
+    return os.getenv("DATABASE_ASYNC", "false").lower() in ("1", "true", "yes")
+
+
+def get_engine_options(database_url: str) -> Dict[str, Any]:
+    options: Dict[str, Any] = {
+        "echo": False,
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "false").lower()
+        in ("1", "true", "yes"),
+    }
+
+    # "null" opens a connection per checkout, for transaction-pooling proxies
+    # such as PgBouncer that already pool server connections
+    if os.getenv("DB_POOL_MODE", "queue").lower() == "null":
+        options["poolclass"] = NullPool
+    elif make_url(database_url).get_backend_name() != "sqlite":
+        options["pool_size"] = int(os.getenv("DB_POOL_SIZE", 5))
+        options["max_overflow"] = int(os.getenv("DB_MAX_OVERFLOW", 10))
+        options["pool_timeout"] = float(os.getenv("DB_POOL_TIMEOUT", 30))
+        options["pool_recycle"] = int(os.getenv("DB_POOL_RECYCLE", -1))
+    return options
+
+
+def _enable_sqlite_foreign_keys(engine: Engine) -> None:
+    # SQLite ignores foreign keys (and so ON DELETE CASCADE) unless asked per connection
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 def get_engine() -> Engine:
-    database_url = get_database_url()
-    return create_engine(database_url, echo=False)
+    # Created on first use, so importing this module never opens a pool
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                database_url = get_database_url()
+                _engine = create_engine(
+                    database_url, **get_engine_options(database_url)
+                )
+                _enable_sqlite_foreign_keys(_engine)
+    return _engine
+
+
+def get_async_engine() -> AsyncEngine:
+    # Created on first use so the async driver is only required in async mode
+    global _async_engine
+    if _async_engine is None:
+        with _engine_lock:
+            if _async_engine is None:
+                database_url = get_async_database_url()
+                _async_engine = create_async_engine(
+                    database_url, **get_engine_options(database_url)
+                )
+                _enable_sqlite_foreign_keys(_async_engine.sync_engine)
+    return _async_engine
+
+
+def dispose_engine() -> None:
+    # Drops pooled connections, e.g. after fork or on worker shutdown; the
+    # engines stay usable and reconnect on demand
+    if _engine is not None:
+        _engine.dispose()
 
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+async def dispose_async_engine() -> None:
+    if _async_engine is not None:
+        await _async_engine.dispose()
+
+
+def _pool_status(engine: Engine) -> Dict[str, Any]:
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            stats[name] = method()
+    return stats
+
+
+def get_pool_status() -> Dict[str, Any]:
+    status: Dict[str, Any] = {}
+    if _engine is not None:
+        status["sync"] = _pool_status(_engine)
+    if _async_engine is not None:
+        status["async"] = _pool_status(_async_engine.sync_engine)
+    return status
+
+
+class LazySessionmaker(sessionmaker):
+
+    def __call__(self, **local_kw: Any) -> Session:
+        if self.kw.get("bind") is None:
+            local_kw.setdefault("bind", get_engine())
+        return super().__call__(**local_kw)
+
+
+SessionLocal = LazySessionmaker(autocommit=False, autoflush=False)
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        _async_sessionmaker = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_sessionmaker
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -35,4 +178,17 @@ def get_session() -> Generator[Session, None, None]:
     finally:
         session.close()
 
-get_db = get_session
\ No newline at end of file
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    session = get_async_sessionmaker()()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+get_db = get_session
+get_async_db = get_async_session
@@ -0,0 +1,39 @@
+from app.events.broker import (
+    Event,
+    EventBroker,
+    get_broker,
+    get_events_backend,
+    is_events_enabled,
+    resync_event,
+)
+from app.events.deadlines import (
+    attach_scheduler,
+    record_deadline_refresh,
+    record_deadlines,
+)
+from app.events.publisher import (
+    project_deleted,
+    record_events,
+    task_created,
+    task_deleted,
+    task_status_changed,
+    tasks_imported,
+)
+
+__all__ = [
+    "Event",
+    "EventBroker",
+    "get_broker",
+    "get_events_backend",
+    "is_events_enabled",
+    "resync_event",
+    "record_events",
+    "task_created",
+    "task_status_changed",
+    "task_deleted",
+    "tasks_imported",
+    "project_deleted",
+    "attach_scheduler",
+    "record_deadlines",
+    "record_deadline_refresh",
+]
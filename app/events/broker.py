@@ -0,0 +1,111 @@
+import asyncio
+import os
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+EVENTS_BACKENDS = ("none", "memory", "postgres")
+
+Event = Dict[str, Any]
+
+
+def resync_event(project_id: int) -> Event:
+    # Sent when a subscriber may have missed events; clients refetch the list
+    return {"type": "resync", "project_id": project_id}
+
+
+class EventBroker:
+
+    def __init__(self, queue_size: int = 1000):
+        self.queue_size = queue_size
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+
+    def close(self) -> None:
+        # Ends every open stream (each queue gets None); runs on the event loop
+        self._loop = None
+        for queues in self._subscribers.values():
+            for queue in queues:
+                self._replace(queue, None)
+
+    def publish(self, events: Iterable[Event]) -> None:
+        # Called from request threads, the scheduler and the LISTEN thread, so
+        # delivery is handed to the event loop that owns the queues
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._dispatch, list(events))
+        except RuntimeError:
+            pass  # loop already closed
+
+    def resync_all(self) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._resync_all)
+        except RuntimeError:
+            pass
+
+    @asynccontextmanager
+    async def subscribe(self, project_id: int) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        self._subscribers[project_id].add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(project_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[project_id]
+
+    def _dispatch(self, events: List[Event]) -> None:
+        for event in events:
+            for queue in tuple(self._subscribers.get(event["project_id"], ())):
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    # A slow consumer gets one resync instead of an unbounded backlog
+                    self._replace(queue, resync_event(event["project_id"]))
+
+    def _resync_all(self) -> None:
+        for project_id, queues in self._subscribers.items():
+            for queue in queues:
+                self._replace(queue, resync_event(project_id))
+
+    @staticmethod
+    def _replace(queue: asyncio.Queue, item: Optional[Event]) -> None:
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(item)
+
+
+@lru_cache(maxsize=1)
+def get_events_backend() -> str:
+    backend = os.getenv("EVENTS_BACKEND", "none").lower()
+    if backend not in EVENTS_BACKENDS:
+        raise ValueError(f"Unknown EVENTS_BACKEND '{backend}'.")
+    return backend
+
+
+def is_events_enabled() -> bool:
+    return get_events_backend() != "none"
+
+
+@lru_cache(maxsize=1)
+def get_broker() -> EventBroker:
+    return EventBroker(int(os.getenv("EVENTS_QUEUE_SIZE", 1000)))
@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+if TYPE_CHECKING:
+    from app.commands.scheduler import DeadlineScheduler
+
+PENDING_KEY = "task_deadlines"
+REFRESH_KEY = "task_deadlines_refresh"
+
+# The scheduler embedded in this process, if any; a standalone scheduler
+# finds the same writes through its periodic refresh instead
+_scheduler: Optional["DeadlineScheduler"] = None
+
+
+def attach_scheduler(scheduler: Optional["DeadlineScheduler"]) -> None:
+    global _scheduler
+    _scheduler = scheduler
+
+
+def _notify_after_commit(session: Session) -> None:
+    pending: List[Tuple[int, datetime]] = session.info.pop(PENDING_KEY, [])
+    refresh = session.info.pop(REFRESH_KEY, False)
+    scheduler = _scheduler
+    if scheduler is not None and (pending or refresh):
+        scheduler.notify(pending, refresh)
+
+
+def _discard_pending(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
+    session.info.pop(REFRESH_KEY, None)
+
+
+def _listen(session: Session) -> None:
+    if not event.contains(session, "after_commit", _notify_after_commit):
+        event.listen(session, "after_commit", _notify_after_commit)
+        event.listen(session, "after_rollback", _discard_pending)
+
+
+def record_deadlines(
+    session: Session, deadlines: Iterable[Tuple[int, Optional[datetime]]]
+) -> None:
+    # (task_id, deadline) pairs of open tasks, handed to the scheduler only
+    # once the transaction commits, like the change feed events
+    if _scheduler is None:
+        return
+
+    pending = [(task_id, deadline) for task_id, deadline in deadlines if deadline]
+    if pending:
+        session.info.setdefault(PENDING_KEY, []).extend(pending)
+        _listen(session)
+
+
+def record_deadline_refresh(session: Session) -> None:
+    # For writes that do not return their rows (bulk imports): the scheduler
+    # runs its incremental refresh early instead
+    if _scheduler is None:
+        return
+
+    session.info[REFRESH_KEY] = True
+    _listen(session)
@@ -0,0 +1,67 @@
+import json
+import select
+import sys
+import threading
+from datetime import datetime
+from typing import Optional
+
+from app.db.session import get_engine
+from app.events.broker import EventBroker
+from app.events.publisher import CHANNEL
+
+
+class PostgresEventListener:
+
+    def __init__(self, broker: EventBroker, poll_seconds: float = 5.0):
+        self.broker = broker
+        self.poll_seconds = poll_seconds
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if get_engine().dialect.name != "postgresql":
+            raise ValueError("EVENTS_BACKEND=postgres requires a PostgreSQL DATABASE_URL.")
+
+        self._thread = threading.Thread(
+            target=self._run, name="task-events-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(self.poll_seconds + 1)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                print(
+                    f"[{datetime.now().isoformat()}] Event listener error: {e}",
+                    file=sys.stderr,
+                )
+                # Notifications sent while disconnected are lost
+                self.broker.resync_all()
+                self._stopped.wait(self.poll_seconds)
+
+    def _listen(self) -> None:
+        # A dedicated connection, detached so it never goes back to the pool
+        connection = get_engine().raw_connection()
+        connection.detach()
+        try:
+            dbapi_connection = connection.driver_connection
+            dbapi_connection.autocommit = True
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+
+            while not self._stopped.is_set():
+                readable, _, _ = select.select([dbapi_connection], [], [], self.poll_seconds)
+                if not readable:
+                    continue
+                dbapi_connection.poll()
+                while dbapi_connection.notifies:
+                    notify = dbapi_connection.notifies.pop(0)
+                    self.broker.publish(json.loads(notify.payload))
+        finally:
+            connection.close()
@@ -0,0 +1,100 @@
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
+
+from pydantic_core import to_json
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.orm import Session
+
+from app.events.broker import Event, get_broker, get_events_backend, resync_event
+
+PENDING_KEY = "task_events"
+CHANNEL = "task_events"
+# NOTIFY payloads must stay under 8000 bytes
+MAX_PAYLOAD_BYTES = 7900
+
+
+def task_created(task) -> Event:
+    mapper = inspect(task).mapper
+    return {
+        "type": "task.created",
+        "project_id": task.project_id,
+        "task": {attr.key: getattr(task, attr.key) for attr in mapper.column_attrs},
+    }
+
+
+def task_status_changed(
+    task_id: int,
+    project_id: int,
+    status: str,
+    closed_at: Optional[datetime],
+    version: int,
+) -> Event:
+    return {
+        "type": "task.status_changed",
+        "project_id": project_id,
+        "task_id": task_id,
+        "status": status,
+        "closed_at": closed_at,
+        "version": version,
+    }
+
+
+def task_deleted(task_id: int, project_id: int) -> Event:
+    return {"type": "task.deleted", "project_id": project_id, "task_id": task_id}
+
+
+def tasks_imported(project_id: int, count: int) -> Event:
+    # Bulk inserts do not return rows, so clients reload the list instead
+    return {"type": "tasks.imported", "project_id": project_id, "count": count}
+
+
+def project_deleted(project_id: int) -> Event:
+    return {"type": "project.deleted", "project_id": project_id}
+
+
+def notify_payloads(events: Iterable[Event]) -> Iterator[str]:
+    # JSON arrays of as many events as fit in one NOTIFY
+    chunk: List[bytes] = []
+    size = 2
+    for pending in events:
+        encoded = to_json(pending)
+        if len(encoded) + 2 > MAX_PAYLOAD_BYTES:
+            encoded = to_json(resync_event(pending["project_id"]))
+        if chunk and size + len(encoded) + 1 > MAX_PAYLOAD_BYTES:
+            yield "[" + b",".join(chunk).decode() + "]"
+            chunk, size = [], 2
+        chunk.append(encoded)
+        size += len(encoded) + 1
+    if chunk:
+        yield "[" + b",".join(chunk).decode() + "]"
+
+
+def _notify_before_commit(session: Session) -> None:
+    # pg_notify is transactional: listeners receive it on commit, never on rollback
+    for payload in notify_payloads(session.info.get(PENDING_KEY, ())):
+        session.execute(select(func.pg_notify(CHANNEL, payload)))
+
+
+def _publish_after_commit(session: Session) -> None:
+    pending: List[Event] = session.info.pop(PENDING_KEY, [])
+    # With the postgres backend the events come back through LISTEN instead
+    if pending and get_events_backend() == "memory":
+        get_broker().publish(pending)
+
+
+def _discard_pending(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
+
+
+def record_events(session: Session, events: Iterable[Event]) -> None:
+    # Queued on the session and only published once the transaction commits
+    backend = get_events_backend()
+    if backend == "none":
+        return
+
+    session.info.setdefault(PENDING_KEY, []).extend(events)
+    if not event.contains(session, "after_commit", _publish_after_commit):
+        if backend == "postgres":
+            event.listen(session, "before_commit", _notify_before_commit)
+        event.listen(session, "after_commit", _publish_after_commit)
+        event.listen(session, "after_rollback", _discard_pending)
@@ -3,6 +3,7 @@ from app.exceptions.repository_exceptions import (
     RepositoryException,
     EntityNotFoundException,
     DuplicateEntityException,
+    ConcurrentModificationException,
 )
 from app.exceptions.service_exceptions import (
     ServiceException,
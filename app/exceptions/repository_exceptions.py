@@ -13,6 +13,13 @@ class EntityNotFoundException(RepositoryException):
         super().__init__(message)
 
 
+class ConcurrentModificationException(RepositoryException):
+
+    def __init__(self, entity_type: str, entity_id: int):
+        message = f"{entity_type} with ID {entity_id} was modified concurrently."
+        super().__init__(message)
+
+
 class DuplicateEntityException(RepositoryException):
 
     def __init__(self, entity_type: str, field: str, value: str):
@@ -0,0 +1,68 @@
+import os
+from functools import lru_cache
+from typing import List
+
+from dotenv import load_dotenv
+
+from app.metrics.middleware import InstrumentationMiddleware, install_query_hooks
+from app.metrics.registry import RequestMetrics, render_samples
+
+load_dotenv()
+
+
+def is_metrics_enabled() -> bool:
+    return os.getenv("METRICS_ENABLED", "false").lower() in ("1", "true", "yes")
+
+
+def is_server_timing_enabled() -> bool:
+    return os.getenv("SERVER_TIMING_ENABLED", "false").lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=1)
+def get_request_metrics() -> RequestMetrics:
+    return RequestMetrics()
+
+
+def render_metrics() -> str:
+    # Imported here so the metrics package does not pull in the DB/cache setup
+    from app.cache import get_cache
+    from app.db.session import get_pool_status
+
+    lines: List[str] = get_request_metrics().render()
+
+    pool_samples = [
+        ((("engine", engine), ("state", state)), value)
+        for engine, status in get_pool_status().items()
+        for state, value in status.items()
+        if state != "pool_class"
+    ]
+    lines += render_samples(
+        "db_pool_connections",
+        "Connection pool state per engine (size, checkedin, checkedout, overflow).",
+        "gauge",
+        pool_samples,
+    )
+
+    cache = get_cache()
+    if cache is not None:
+        lines += render_samples(
+            "cache_operations_total",
+            "Repository cache operations since startup.",
+            "counter",
+            [
+                ((("backend", cache.name), ("operation", operation)), value)
+                for operation, value in cache.stats.as_dict().items()
+            ],
+        )
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "InstrumentationMiddleware",
+    "RequestMetrics",
+    "get_request_metrics",
+    "install_query_hooks",
+    "is_metrics_enabled",
+    "is_server_timing_enabled",
+    "render_metrics",
+]
@@ -0,0 +1,108 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics.registry import RequestMetrics
+
+
+class RequestStats:
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+
+
+# Set per request by the middleware; sync handlers run in worker threads with a
+# copy of the context, so they still update the same RequestStats object
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the per-statement context rather than the connection, so a
+    # statement that raises (no after_cursor_execute) leaves nothing behind
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    stats = _request_stats.get()
+    if stats is not None and started is not None:
+        stats.queries += 1
+        stats.db_time += time.perf_counter() - started
+
+
+def install_query_hooks() -> None:
+    # Listens on the Engine class, so it covers the sync engine and the one
+    # behind the async engine alike
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def server_timing(duration: float, stats: RequestStats) -> str:
+    return (
+        f'app;dur={duration * 1000:.1f}, '
+        f'db;dur={stats.db_time * 1000:.1f};desc="{stats.queries} queries"'
+    )
+
+
+class InstrumentationMiddleware:
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: Optional[RequestMetrics] = None,
+        server_timing: bool = False,
+    ):
+        self.app = app
+        self.metrics = metrics
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    # Streaming bodies are still being produced here, so the
+                    # header covers the work done before the first byte
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        server_timing(time.perf_counter() - started, stats),
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            if self.metrics is not None:
+                # The router stores the matched route in the scope; templates
+                # keep label cardinality bounded
+                route = getattr(scope.get("route"), "path", "unmatched")
+                self.metrics.observe(
+                    scope["method"],
+                    route,
+                    status_code,
+                    time.perf_counter() - started,
+                    stats.queries,
+                    stats.db_time,
+                )
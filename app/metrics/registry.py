@@ -0,0 +1,106 @@
+import bisect
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# Seconds; tuned for API requests that mostly finish well under a second
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+class Histogram:
+
+    def __init__(self, name: str, description: str, buckets: Sequence[float]):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # labels -> (per-bucket counts, sum, count)
+        self._series: Dict[Labels, Tuple[List[int], float, int]] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total, count = self._series.get(
+                labels, ([0] * len(self.buckets), 0.0, 0)
+            )
+            if index < len(counts):
+                counts[index] += 1
+            self._series[labels] = (counts, total + value, count + 1)
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = {labels: (list(c), s, n) for labels, (c, s, n) in self._series.items()}
+        for labels, (counts, total, count) in sorted(series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                bucket_labels = labels + (("le", f"{bound:g}"),)
+                lines.append(f"{self.name}_bucket{format_labels(bucket_labels)} {cumulative}")
+            lines.append(f'{self.name}_bucket{format_labels(labels + (("le", "+Inf"),))} {count}')
+            lines.append(f"{self.name}_sum{format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{format_labels(labels)} {count}")
+        return lines
+
+
+def render_samples(
+    name: str,
+    description: str,
+    metric_type: str,
+    samples: Sequence[Tuple[Labels, float]],
+) -> List[str]:
+    lines = [f"# HELP {name} {description}", f"# TYPE {name} {metric_type}"]
+    lines.extend(f"{name}{format_labels(labels)} {value}" for labels, value in samples)
+    return lines
+
+
+class RequestMetrics:
+
+    def __init__(self):
+        self.duration = Histogram(
+            "http_request_duration_seconds",
+            "Time spent handling HTTP requests, by route template.",
+            DURATION_BUCKETS,
+        )
+        self.queries = Histogram(
+            "http_request_db_queries",
+            "SQL statements executed per HTTP request.",
+            QUERY_COUNT_BUCKETS,
+        )
+        self.db_time = Histogram(
+            "http_request_db_duration_seconds",
+            "Time spent executing SQL per HTTP request.",
+            DURATION_BUCKETS,
+        )
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        duration: float,
+        queries: int,
+        db_time: float,
+    ) -> None:
+        route_labels: Labels = (("method", method), ("route", route))
+        self.duration.observe(route_labels + (("status", str(status_code)),), duration)
+        self.queries.observe(route_labels, queries)
+        self.db_time.observe(route_labels, db_time)
+
+    def render(self) -> List[str]:
+        return self.duration.render() + self.queries.render() + self.db_time.render()
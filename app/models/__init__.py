@@ -1,2 +1,3 @@
+from app.models.idempotency_key import IdempotencyKey
 from app.models.project import Project
 from app.models.task import Task
@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class IdempotencyKey(Base):
+
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # sha256 of method, path and body; a reused key must match it
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Unset while the first request holding the key is still running
+    status_code: Mapped[Optional[int]] = mapped_column(nullable=True)
+    response_body: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.now)
+    expires_at: Mapped[datetime] = mapped_column(nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"IdempotencyKey(key='{self.key}', status_code={self.status_code})"
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -18,11 +18,24 @@ class Project(Base):
     name: Mapped[str] = mapped_column(String(30), unique=True, nullable=False)
     description: Mapped[str] = mapped_column(String(150), nullable=False)
     created_at: Mapped[datetime] = mapped_column(default=datetime.now)
+    task_count: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+    # Bumped on every task write in the project; drives ETag/Last-Modified
+    revision: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
+    # Optimistic concurrency for the project's own fields; unlike revision it
+    # is not bumped by task writes
+    version: Mapped[int] = mapped_column(server_default="1", nullable=False)
+
+    __mapper_args__ = {"version_id_col": version}
 
     tasks: Mapped[List["Task"]] = relationship(
         "Task",
         back_populates="project",
         cascade="all, delete-orphan",
+        # Tasks are removed by ON DELETE CASCADE instead of being loaded and
+        # deleted one by one
+        passive_deletes=True,
+        order_by="(Task.created_at, Task.id)",
     )
 
     def __str__(self) -> str:
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, func, literal_column, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -9,19 +9,49 @@ from app.db.base import Base
 if TYPE_CHECKING:
     from app.models.project import Project
 
+SEARCH_CONFIG = "english"
+
 
 class Task(Base):
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Serves project listings ordered/paginated by (created_at, id) and counts
+        Index("ix_tasks_project_id_created_at_id", "project_id", "created_at", "id"),
+        # Partial index for the overdue scan; closed tasks never match it
+        Index(
+            "ix_tasks_open_deadline",
+            "deadline",
+            postgresql_where=text("status <> 'done'"),
+            sqlite_where=text("status <> 'done'"),
+        ),
+        # Full-text search (PostgreSQL only; other backends fall back to LIKE)
+        Index(
+            "ix_tasks_search",
+            text(f"to_tsvector('{SEARCH_CONFIG}'::regconfig, title || ' ' || description)"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"), nullable=False)
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
     title: Mapped[str] = mapped_column(String(30), nullable=False)
     description: Mapped[str] = mapped_column(String(150), nullable=False)
     status: Mapped[str] = mapped_column(String(10), default="todo", nullable=False)
     deadline: Mapped[Optional[datetime]] = mapped_column(nullable=True)
     closed_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
     created_at: Mapped[datetime] = mapped_column(default=datetime.now)
+    # Stamped on insert and on every UPDATE (bulk ones too, through onupdate),
+    # so the deadline scheduler can pick up reopened and imported tasks
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.now, onupdate=datetime.now, nullable=True
+    )
+    # Optimistic concurrency: ORM UPDATE/DELETE match on the version they read
+    version: Mapped[int] = mapped_column(server_default="1", nullable=False)
+
+    __mapper_args__ = {"version_id_col": version}
 
     project: Mapped["Project"] = relationship("Project", back_populates="tasks")
 
@@ -30,3 +60,11 @@ class Task(Base):
 
     def __repr__(self) -> str:
         return f"Task(id={self.id}, title='{self.title}', status='{self.status}')"
+
+
+# Full-text document searched by TaskRepository.search; it must render the
+# same expression as ix_tasks_search for PostgreSQL to use the index
+task_search_document = func.to_tsvector(
+    literal_column(f"'{SEARCH_CONFIG}'::regconfig"),
+    Task.title + literal_column("' '") + Task.description,
+)
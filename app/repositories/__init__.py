@@ -1,2 +1,6 @@
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.task_repository import TaskRepository
+from app.repositories.async_project_repository import AsyncProjectRepository
+from app.repositories.async_task_repository import AsyncTaskRepository
+from app.repositories.idempotency_repository import IdempotencyRepository
+from app.repositories.async_idempotency_repository import AsyncIdempotencyRepository
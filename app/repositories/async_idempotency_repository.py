@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import CacheBackend, get_idempotency_cache
+from app.cache.backends import CacheValue
+from app.models.idempotency_key import IdempotencyKey
+from app.repositories.idempotency_repository import (
+    cached_record,
+    get_idempotency_ttl,
+    purge_query,
+    remember_after_commit,
+    to_record,
+)
+
+
+class AsyncIdempotencyRepository:
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache: Optional[CacheBackend] = None,
+        ttl: Optional[timedelta] = None,
+    ):
+        self.session = session
+        self.cache = cache if cache is not None else get_idempotency_cache()
+        self.ttl = ttl if ttl is not None else get_idempotency_ttl()
+
+    async def claim(
+        self, key: str, fingerprint: str, now: datetime
+    ) -> Optional[CacheValue]:
+        record = cached_record(self.cache, key, now)
+        if record is not None:
+            return record
+
+        stored = await self.session.get(IdempotencyKey, key)
+        if stored is not None:
+            if stored.expires_at > now:
+                return self._remember(stored)
+            await self.session.delete(stored)
+
+        self.session.add(
+            IdempotencyKey(
+                key=key, fingerprint=fingerprint, created_at=now, expires_at=now + self.ttl
+            )
+        )
+        try:
+            await self.session.flush()
+        except IntegrityError:
+            await self.session.rollback()
+            stored = await self.session.get(IdempotencyKey, key)
+            if stored is None:
+                raise
+            return self._remember(stored)
+        return None
+
+    async def complete(self, key: str, status_code: int, body: str) -> None:
+        stored = await self.session.get(IdempotencyKey, key)
+        stored.status_code = status_code
+        stored.response_body = body
+        remember_after_commit(self.session.sync_session, key, to_record(stored))
+
+    async def delete_expired(self, now: datetime) -> int:
+        result = await self.session.execute(purge_query(now))
+        return result.rowcount
+
+    def _remember(self, stored: IdempotencyKey) -> CacheValue:
+        record = to_record(stored)
+        if stored.status_code is not None:
+            self.cache.set(stored.key, record)
+        return record
@@ -0,0 +1,118 @@
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Row, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.events import project_deleted, record_events
+from app.exceptions.repository_exceptions import (
+    ConcurrentModificationException,
+    DuplicateEntityException,
+    EntityNotFoundException,
+)
+from app.models.project import Project
+from app.repositories.project_repository import (
+    fresh_query,
+    list_version_query,
+    page_query,
+    page_versions_query,
+    page_with_tasks_query,
+    summary_query,
+    task_list_version_query,
+)
+
+
+class AsyncProjectRepository:
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_all(self) -> List[Project]:
+        stmt = select(Project).order_by(Project.created_at)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_row_page(
+        self,
+        columns: Sequence[Any],
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Row]:
+        stmt = page_query(select(*columns), limit, after)
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def get_page_with_tasks(
+        self,
+        project_columns: Sequence[Any],
+        task_columns: Sequence[Any],
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Project]:
+        stmt = page_with_tasks_query(project_columns, task_columns, limit, after)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_summaries(self, statuses: Sequence[str], now: datetime) -> List[Row]:
+        result = await self.session.execute(summary_query(statuses, now))
+        return list(result.all())
+
+    async def get_page_versions(
+        self, limit: int, after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Row]:
+        result = await self.session.execute(page_versions_query(limit, after))
+        return list(result.all())
+
+    async def get_list_version(self) -> Tuple[int, Optional[int]]:
+        result = await self.session.execute(list_version_query())
+        count, max_id = result.one()
+        return count, max_id
+
+    async def get_task_list_version(self, project_id: int) -> Optional[Row]:
+        result = await self.session.execute(task_list_version_query(project_id))
+        return result.one_or_none()
+
+    async def get_by_id(self, project_id: int) -> Optional[Project]:
+        stmt = select(Project).where(Project.id == project_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_fresh(self, project_id: int) -> Optional[Project]:
+        result = await self.session.execute(fresh_query(project_id))
+        return result.scalar_one_or_none()
+
+    async def get_by_name(self, name: str) -> Optional[Project]:
+        stmt = select(Project).where(Project.name == name)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def count(self) -> int:
+        stmt = select(func.count()).select_from(Project)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def create(self, name: str, description: str) -> Project:
+        # Check for duplicate name
+        existing = await self.get_by_name(name)
+        if existing:
+            raise DuplicateEntityException("Project", "name", name)
+
+        project = Project(name=name, description=description)
+        self.session.add(project)
+        await self.session.flush()  # Get the ID
+        return project
+
+    async def delete(self, project_id: int) -> Project:
+        project = await self.get_by_id(project_id)
+        if not project:
+            raise EntityNotFoundException("Project", project_id)
+
+        await self.session.delete(project)
+        # Matches on the version that was read, like task writes
+        try:
+            await self.session.flush()
+        except StaleDataError:
+            raise ConcurrentModificationException("Project", project_id)
+        record_events(self.session.sync_session, [project_deleted(project_id)])
+        return project
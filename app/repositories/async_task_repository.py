@@ -0,0 +1,205 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import Row, RowMapping, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.events import (
+    record_deadlines,
+    record_events,
+    task_created,
+    task_deleted,
+    task_status_changed,
+)
+from app.exceptions.repository_exceptions import (
+    ConcurrentModificationException,
+    EntityNotFoundException,
+)
+from app.models.task import Task
+from app.repositories.task_repository import (
+    close_overdue_query,
+    closed_events,
+    count_query,
+    counts_by_project_query,
+    ids_in_project_query,
+    open_deadlines,
+    project_page_query,
+    set_status,
+    status_changed_events,
+    status_update_query,
+    task_rows,
+    touch_projects_query,
+)
+
+
+class AsyncTaskRepository:
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_all(self) -> List[Task]:
+        stmt = select(Task).order_by(Task.created_at)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        stmt = select(Task).where(Task.id == task_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_by_project_id(self, project_id: int) -> List[Task]:
+        stmt = select(Task).where(Task.project_id == project_id).order_by(Task.created_at)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_row_page_by_project_id(
+        self,
+        columns: Sequence[Any],
+        project_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        status: Optional[str] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+    ) -> List[Row]:
+        stmt = project_page_query(
+            select(*columns), project_id, limit, after, status, deadline_from, deadline_to
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def count_by_project_id(self, project_id: int) -> int:
+        result = await self.session.execute(count_query(project_id))
+        return result.scalar_one()
+
+    async def count_by_project_ids(self, project_ids: Iterable[int]) -> Dict[int, int]:
+        counts = {project_id: 0 for project_id in project_ids}
+        if not counts:
+            return counts
+
+        result = await self.session.execute(counts_by_project_query(list(counts)))
+        counts.update({project_id: count for project_id, count in result.all()})
+        return counts
+
+    async def _flush_versioned(self, task: Task) -> None:
+        # The UPDATE/DELETE matches on the version that was read; if another
+        # writer got there first it matches nothing and we report a conflict
+        task_id = task.id  # unreadable once the failed flush has expired it
+        try:
+            await self.session.flush()
+        except StaleDataError:
+            raise ConcurrentModificationException("Task", task_id)
+
+    async def _touch_projects(
+        self, project_ids: Iterable[int], task_delta: int = 0
+    ) -> None:
+        project_ids = list(project_ids)
+        if project_ids:
+            await self.session.execute(touch_projects_query(project_ids, task_delta))
+
+    async def create(
+        self,
+        project_id: int,
+        title: str,
+        description: str,
+        deadline: Optional[datetime] = None,
+    ) -> Task:
+        task = Task(
+            project_id=project_id,
+            title=title,
+            description=description,
+            deadline=deadline,
+        )
+        self.session.add(task)
+        await self.session.flush()  # Get the ID
+        await self._touch_projects([project_id], task_delta=1)
+        record_events(self.session.sync_session, [task_created(task)])
+        record_deadlines(self.session.sync_session, [(task.id, task.deadline)])
+        return task
+
+    async def create_many(
+        self, project_id: int, tasks: List[Dict[str, Any]]
+    ) -> List[Task]:
+        # See TaskRepository.create_many
+        result = await self.session.scalars(
+            insert(Task).returning(Task), task_rows(project_id, tasks)
+        )
+        created = sorted(result.all(), key=lambda task: task.id)
+        await self._touch_projects([project_id], task_delta=len(created))
+        record_events(self.session.sync_session, (task_created(task) for task in created))
+        record_deadlines(
+            self.session.sync_session, ((task.id, task.deadline) for task in created)
+        )
+        return created
+
+    async def get_ids_in_project(
+        self, project_id: int, task_ids: Iterable[int]
+    ) -> Set[int]:
+        result = await self.session.scalars(ids_in_project_query(project_id, task_ids))
+        return set(result.all())
+
+    async def apply_statuses(
+        self, project_id: int, task_ids_by_status: Dict[str, List[int]]
+    ) -> List[RowMapping]:
+        now = datetime.now()
+        updated: List[RowMapping] = []
+        for new_status, task_ids in task_ids_by_status.items():
+            stmt = status_update_query(project_id, task_ids, new_status, now)
+            result = await self.session.execute(stmt)
+            updated.extend(result.mappings().all())
+
+        if updated:
+            await self._touch_projects([project_id])
+            record_events(
+                self.session.sync_session, status_changed_events(project_id, updated)
+            )
+            record_deadlines(self.session.sync_session, open_deadlines(updated))
+        return updated
+
+    async def update_status(self, task_id: int, new_status: str) -> Task:
+        task = await self.get_by_id(task_id)
+        if not task:
+            raise EntityNotFoundException("Task", task_id)
+
+        return await self.apply_status(task, new_status)
+
+    async def apply_status(self, task: Task, new_status: str) -> Task:
+        old_status = set_status(task, new_status)
+        await self._flush_versioned(task)
+        await self._touch_projects([task.project_id])
+        if new_status != old_status:
+            record_events(
+                self.session.sync_session,
+                [
+                    task_status_changed(
+                        task.id, task.project_id, new_status, task.closed_at, task.version
+                    )
+                ],
+            )
+            if new_status != "done":
+                record_deadlines(self.session.sync_session, [(task.id, task.deadline)])
+        return task
+
+    async def close_overdue_batch(
+        self, now: datetime, batch_size: Optional[int] = None
+    ) -> List[int]:
+        result = await self.session.execute(close_overdue_query(now, batch_size))
+        closed = result.all()
+        await self._touch_projects({project_id for _, project_id, _ in closed})
+        record_events(self.session.sync_session, closed_events(now, closed))
+        return [task_id for task_id, _, _ in closed]
+
+    async def delete(self, task_id: int) -> Task:
+        task = await self.get_by_id(task_id)
+        if not task:
+            raise EntityNotFoundException("Task", task_id)
+
+        return await self.delete_instance(task)
+
+    async def delete_instance(self, task: Task) -> Task:
+        await self.session.delete(task)
+        await self._flush_versioned(task)
+        await self._touch_projects([task.project_id], task_delta=-1)
+        record_events(self.session.sync_session, [task_deleted(task.id, task.project_id)])
+        return task
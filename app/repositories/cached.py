@@ -0,0 +1,216 @@
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from sqlalchemy import RowMapping, event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+
+from app.cache import CacheBackend, get_cache
+from app.models.project import Project
+from app.models.task import Task
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+
+Entity = TypeVar("Entity", Project, Task)
+
+PENDING_KEY = "cache_invalidations"
+TOMBSTONES_KEY = "cache_tombstones"
+
+
+def project_key(project_id: int) -> str:
+    return f"project:{project_id}"
+
+
+def task_key(task_id: int) -> str:
+    return f"task:{task_id}"
+
+
+def deleted_project_key(project_id: int) -> str:
+    return f"project-deleted:{project_id}"
+
+
+def _to_row(entity: Union[Project, Task]) -> Dict[str, Any]:
+    mapper = inspect(entity).mapper
+    return {attr.key: getattr(entity, attr.key) for attr in mapper.column_attrs}
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    pending: Set[str] = session.info.pop(PENDING_KEY, set())
+    tombstones: Dict[str, Dict[str, Any]] = session.info.pop(TOMBSTONES_KEY, {})
+    cache = get_cache()
+    if cache is None:
+        return
+    if pending:
+        cache.delete(*pending)
+    for key, value in tombstones.items():
+        cache.set(key, value)
+
+
+def _discard_pending(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
+    session.info.pop(TOMBSTONES_KEY, None)
+
+
+class CachingMixin:
+
+    session: Session
+    cache: CacheBackend
+
+    def _invalidate(self, *keys: str) -> None:
+        # Drop now, and again after commit so readers that raced the write
+        # cannot leave pre-commit data behind
+        self.cache.delete(*keys)
+        self.session.info.setdefault(PENDING_KEY, set()).update(keys)
+        self._listen()
+
+    def _tombstone(self, key: str, value: Dict[str, Any]) -> None:
+        # Marks a group of entries stale without knowing their keys; written
+        # now and again after commit, like invalidations
+        self.cache.set(key, value)
+        self.session.info.setdefault(TOMBSTONES_KEY, {})[key] = value
+        self._listen()
+
+    def _listen(self) -> None:
+        if not event.contains(self.session, "after_commit", _invalidate_after_commit):
+            event.listen(self.session, "after_commit", _invalidate_after_commit)
+            event.listen(self.session, "after_rollback", _discard_pending)
+
+    def _is_stale(self, row: Dict[str, Any]) -> bool:
+        return False
+
+    def _cached_get(
+        self,
+        model: Type[Entity],
+        key: str,
+        entity_id: int,
+        load: Callable[[int], Optional[Entity]],
+    ) -> Optional[Entity]:
+        existing = self.session.identity_map.get(identity_key(model, entity_id))
+        if existing is not None:
+            return existing
+
+        # Keys written in this transaction must not be read from or written to the cache
+        pending = self.session.info.get(PENDING_KEY, ())
+        if key not in pending:
+            row = self.cache.get(key)
+            if row is not None and not self._is_stale(row):
+                entity = model(**row)
+                make_transient_to_detached(entity)
+                return self.session.merge(entity, load=False)
+
+        entity = load(entity_id)
+        if entity is not None and key not in pending:
+            self.cache.set(key, _to_row(entity))
+        return entity
+
+
+class CachedProjectRepository(CachingMixin, ProjectRepository):
+
+    def __init__(self, session: Session, cache: CacheBackend):
+        super().__init__(session)
+        self.cache = cache
+
+    def get_by_id(self, project_id: int) -> Optional[Project]:
+        return self._cached_get(
+            Project, project_key(project_id), project_id, super().get_by_id
+        )
+
+    def delete(self, project_id: int) -> Project:
+        project = super().delete(project_id)
+        self._invalidate(project_key(project_id))
+        # The cascade removes the tasks without listing them, so their entries
+        # are retired by a tombstone that CachedTaskRepository checks on reads
+        self._tombstone(deleted_project_key(project_id), {"project_id": project_id})
+        return project
+
+
+class CachedTaskRepository(CachingMixin, TaskRepository):
+
+    def __init__(self, session: Session, cache: CacheBackend):
+        super().__init__(session)
+        self.cache = cache
+
+    def get_by_id(self, task_id: int) -> Optional[Task]:
+        return self._cached_get(Task, task_key(task_id), task_id, super().get_by_id)
+
+    def _is_stale(self, row: Dict[str, Any]) -> bool:
+        # The tombstone outlives the entries it covers: it is written after
+        # them with the same TTL, and these reads keep it recently used
+        return self.cache.get(deleted_project_key(row["project_id"])) is not None
+
+    def _touch_projects(
+        self, project_ids: Iterable[int], task_delta: int = 0
+    ) -> None:
+        project_ids = list(project_ids)
+        super()._touch_projects(project_ids, task_delta)
+        self._invalidate(*(project_key(project_id) for project_id in project_ids))
+
+    def create(
+        self,
+        project_id: int,
+        title: str,
+        description: str,
+        deadline: Optional[datetime] = None,
+    ) -> Task:
+        task = super().create(project_id, title, description, deadline)
+        self._invalidate(task_key(task.id))
+        return task
+
+    def create_many(
+        self, project_id: int, tasks: List[Dict[str, Any]]
+    ) -> List[Task]:
+        created = super().create_many(project_id, tasks)
+        self._invalidate(*(task_key(task.id) for task in created))
+        return created
+
+    def apply_status(self, task: Task, new_status: str) -> Task:
+        self._invalidate(task_key(task.id))
+        return super().apply_status(task, new_status)
+
+    def apply_statuses(
+        self, project_id: int, task_ids_by_status: Dict[str, List[int]]
+    ) -> List[RowMapping]:
+        self._invalidate(
+            *(
+                task_key(task_id)
+                for task_ids in task_ids_by_status.values()
+                for task_id in task_ids
+            )
+        )
+        return super().apply_statuses(project_id, task_ids_by_status)
+
+    def close_overdue_batch(
+        self, now: datetime, batch_size: Optional[int] = None
+    ) -> List[int]:
+        closed_ids = super().close_overdue_batch(now, batch_size)
+        self._invalidate(*(task_key(task_id) for task_id in closed_ids))
+        return closed_ids
+
+    def delete_instance(self, task: Task) -> Task:
+        self._invalidate(task_key(task.id))
+        return super().delete_instance(task)
+
+
+def get_project_repository(session: Session) -> ProjectRepository:
+    cache = get_cache()
+    if cache is None:
+        return ProjectRepository(session)
+    return CachedProjectRepository(session, cache)
+
+
+def get_task_repository(session: Session) -> TaskRepository:
+    cache = get_cache()
+    if cache is None:
+        return TaskRepository(session)
+    return CachedTaskRepository(session, cache)
@@ -0,0 +1,119 @@
+import os
+from datetime import datetime, timedelta
+from typing import Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import delete, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.cache import CacheBackend, get_idempotency_cache
+from app.cache.backends import CacheValue
+from app.models.idempotency_key import IdempotencyKey
+
+load_dotenv()
+
+PENDING_KEY = "idempotency_responses"
+
+
+def get_idempotency_ttl() -> timedelta:
+    return timedelta(seconds=float(os.getenv("IDEMPOTENCY_TTL_SECONDS", 86400)))
+
+
+def to_record(stored: IdempotencyKey) -> CacheValue:
+    return {
+        "fingerprint": stored.fingerprint,
+        "status_code": stored.status_code,
+        "body": stored.response_body,
+        "expires_at": stored.expires_at,
+    }
+
+
+def cached_record(cache: CacheBackend, key: str, now: datetime) -> Optional[CacheValue]:
+    record = cache.get(key)
+    if record is not None and record["expires_at"] > now:
+        return record
+    return None
+
+
+def _cache_after_commit(session: Session) -> None:
+    # Only committed responses reach the front; a rolled back claim never does
+    pending = session.info.pop(PENDING_KEY, {})
+    cache = get_idempotency_cache()
+    for key, record in pending.items():
+        cache.set(key, record)
+
+
+def _discard_pending(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
+
+
+def remember_after_commit(session: Session, key: str, record: CacheValue) -> None:
+    session.info.setdefault(PENDING_KEY, {})[key] = record
+    if not event.contains(session, "after_commit", _cache_after_commit):
+        event.listen(session, "after_commit", _cache_after_commit)
+        event.listen(session, "after_rollback", _discard_pending)
+
+
+def purge_query(now: datetime):
+    return delete(IdempotencyKey).where(IdempotencyKey.expires_at <= now)
+
+
+class IdempotencyRepository:
+
+    def __init__(
+        self,
+        session: Session,
+        cache: Optional[CacheBackend] = None,
+        ttl: Optional[timedelta] = None,
+    ):
+        self.session = session
+        self.cache = cache if cache is not None else get_idempotency_cache()
+        self.ttl = ttl if ttl is not None else get_idempotency_ttl()
+
+    def claim(self, key: str, fingerprint: str, now: datetime) -> Optional[CacheValue]:
+        # Returns the record already stored under the key, or inserts a claim
+        # for this request and returns None
+        record = cached_record(self.cache, key, now)
+        if record is not None:
+            return record
+
+        stored = self.session.get(IdempotencyKey, key)
+        if stored is not None:
+            if stored.expires_at > now:
+                return self._remember(stored)
+            self.session.delete(stored)
+
+        self.session.add(
+            IdempotencyKey(
+                key=key, fingerprint=fingerprint, created_at=now, expires_at=now + self.ttl
+            )
+        )
+        try:
+            self.session.flush()
+        except IntegrityError:
+            # A concurrent request committed the key first (on PostgreSQL the
+            # insert waits for it). The claim is the request's first write, so
+            # rolling back loses nothing.
+            self.session.rollback()
+            stored = self.session.get(IdempotencyKey, key)
+            if stored is None:
+                raise
+            return self._remember(stored)
+        return None
+
+    def complete(self, key: str, status_code: int, body: str) -> None:
+        stored = self.session.get(IdempotencyKey, key)
+        stored.status_code = status_code
+        stored.response_body = body
+        remember_after_commit(self.session, key, to_record(stored))
+
+    def delete_expired(self, now: datetime) -> int:
+        result = self.session.execute(purge_query(now))
+        return result.rowcount
+
+    def _remember(self, stored: IdempotencyKey) -> CacheValue:
+        record = to_record(stored)
+        if stored.status_code is not None:
+            self.cache.set(stored.key, record)
+        return record
@@ -1,13 +1,97 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Select, and_, func, select, tuple_
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.events import project_deleted, record_events
 from app.exceptions.repository_exceptions import (
+    ConcurrentModificationException,
     DuplicateEntityException,
     EntityNotFoundException,
 )
 from app.models.project import Project
+from app.models.task import Task
+
+
+def page_query(
+    stmt: Select, limit: int, after: Optional[Tuple[datetime, int]] = None
+) -> Select:
+    # Keyset pagination over (created_at, id); never uses OFFSET
+    if after is not None:
+        stmt = stmt.where(tuple_(Project.created_at, Project.id) > tuple_(*after))
+    return stmt.order_by(Project.created_at, Project.id).limit(limit)
+
+
+def summary_query(statuses: Sequence[str], now: datetime) -> Select:
+    # One grouped pass over tasks for every project; LEFT JOIN keeps empty projects
+    open_task = Task.status != "done"
+    return (
+        select(
+            Project.id,
+            Project.name,
+            *(
+                func.count(Task.id).filter(Task.status == status).label(f"status_{status}")
+                for status in statuses
+            ),
+            func.count(Task.id)
+            .filter(and_(open_task, Task.deadline < now))
+            .label("overdue"),
+            func.min(Task.deadline)
+            .filter(and_(open_task, Task.deadline >= now))
+            .label("next_deadline"),
+        )
+        .outerjoin(Task, Task.project_id == Project.id)
+        .group_by(Project.id)
+        .order_by(Project.created_at, Project.id)
+    )
+
+
+def page_with_tasks_query(
+    project_columns: Sequence[Any],
+    task_columns: Sequence[Any],
+    limit: int,
+    after: Optional[Tuple[datetime, int]] = None,
+) -> Select:
+    # Tasks for the whole page come from one extra SELECT ... WHERE
+    # project_id IN (...), and both sides load only the requested columns
+    return page_query(select(Project), limit, after).options(
+        load_only(*project_columns),
+        selectinload(Project.tasks).load_only(*task_columns),
+    )
+
+
+def page_versions_query(
+    limit: int, after: Optional[Tuple[datetime, int]] = None
+) -> Select:
+    # Task writes bump their project's revision, so (id, revision, version)
+    # over a page changes whenever the page or its embedded tasks do
+    return page_query(select(Project.id, Project.revision, Project.version), limit, after)
+
+
+def list_version_query() -> Select:
+    # Projects are immutable apart from create/delete, so (count, max id)
+    # changes whenever the listing does
+    return select(func.count(), func.max(Project.id))
+
+
+def task_list_version_query(project_id: int) -> Select:
+    # Conditional GETs of a project's tasks; a plain query so the
+    # validator never comes from a cached (possibly stale) project
+    return select(Project.revision, Project.updated_at, Project.created_at).where(
+        Project.id == project_id
+    )
+
+
+def fresh_query(project_id: int) -> Select:
+    # For write-path checks (task limit, If-Match): always hits the
+    # database, also refreshing an instance already in the session
+    return (
+        select(Project)
+        .where(Project.id == project_id)
+        .execution_options(populate_existing=True)
+    )
 
 
 class ProjectRepository:
@@ -20,18 +104,72 @@ class ProjectRepository:
         result = self.session.execute(stmt)
         return list(result.scalars().all())
 
+    def get_page(
+        self, limit: int, after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Project]:
+        stmt = page_query(select(Project), limit, after)
+        result = self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    def get_row_page(
+        self,
+        columns: Sequence[Any],
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Row]:
+        # Same page as get_page, as plain rows of the given columns
+        stmt = page_query(select(*columns), limit, after)
+        result = self.session.execute(stmt)
+        return list(result.all())
+
+    def get_page_with_tasks(
+        self,
+        project_columns: Sequence[Any],
+        task_columns: Sequence[Any],
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Project]:
+        stmt = page_with_tasks_query(project_columns, task_columns, limit, after)
+        result = self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    def get_summaries(self, statuses: Sequence[str], now: datetime) -> List[Row]:
+        result = self.session.execute(summary_query(statuses, now))
+        return list(result.all())
+
+    def get_page_versions(
+        self, limit: int, after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Row]:
+        result = self.session.execute(page_versions_query(limit, after))
+        return list(result.all())
+
+    def get_list_version(self) -> Tuple[int, Optional[int]]:
+        result = self.session.execute(list_version_query())
+        count, max_id = result.one()
+        return count, max_id
+
+    def get_task_list_version(self, project_id: int) -> Optional[Row]:
+        result = self.session.execute(task_list_version_query(project_id))
+        return result.one_or_none()
+
     def get_by_id(self, project_id: int) -> Optional[Project]:
         stmt = select(Project).where(Project.id == project_id)
         result = self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    def get_fresh(self, project_id: int) -> Optional[Project]:
+        result = self.session.execute(fresh_query(project_id))
+        return result.scalar_one_or_none()
+
     def get_by_name(self, name: str) -> Optional[Project]:
         stmt = select(Project).where(Project.name == name)
         result = self.session.execute(stmt)
         return result.scalar_one_or_none()
 
     def count(self) -> int:
-        return len(self.get_all())
+        stmt = select(func.count()).select_from(Project)
+        result = self.session.execute(stmt)
+        return result.scalar_one()
 
     def create(self, name: str, description: str) -> Project:
         # Check for duplicate name
@@ -50,4 +188,10 @@ class ProjectRepository:
             raise EntityNotFoundException("Project", project_id)
 
         self.session.delete(project)
+        # Matches on the version that was read, like task writes
+        try:
+            self.session.flush()
+        except StaleDataError:
+            raise ConcurrentModificationException("Project", project_id)
+        record_events(self.session, [project_deleted(project_id)])
         return project
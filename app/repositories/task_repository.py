@@ -1,11 +1,226 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
-from sqlalchemy import select, and_
+from sqlalchemy import (
+    Float,
+    Row,
+    RowMapping,
+    Select,
+    Update,
+    and_,
+    case,
+    cast,
+    func,
+    insert,
+    literal_column,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
-from app.exceptions.repository_exceptions import EntityNotFoundException
-from app.models.task import Task
+from app.events import (
+    Event,
+    record_deadline_refresh,
+    record_deadlines,
+    record_events,
+    task_created,
+    task_deleted,
+    task_status_changed,
+    tasks_imported,
+)
+from app.exceptions.repository_exceptions import (
+    ConcurrentModificationException,
+    EntityNotFoundException,
+)
+from app.models.project import Project
+from app.models.task import SEARCH_CONFIG, Task, task_search_document
+
+MAX_SEARCH_TERMS = 8
+
+
+def project_page_query(
+    stmt: Select,
+    project_id: int,
+    limit: int,
+    after: Optional[Tuple[datetime, int]] = None,
+    status: Optional[str] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+) -> Select:
+    # Keyset pagination over (created_at, id); never uses OFFSET
+    stmt = stmt.where(Task.project_id == project_id)
+    if after is not None:
+        stmt = stmt.where(tuple_(Task.created_at, Task.id) > tuple_(*after))
+    if status is not None:
+        stmt = stmt.where(Task.status == status)
+    if deadline_from is not None:
+        stmt = stmt.where(Task.deadline >= deadline_from)
+    if deadline_to is not None:
+        stmt = stmt.where(Task.deadline <= deadline_to)
+    return stmt.order_by(Task.created_at, Task.id).limit(limit)
+
+
+def search_query(
+    columns: Sequence[Any],
+    dialect_name: str,
+    query: str,
+    limit: int,
+    after: Optional[Tuple[float, int]] = None,
+    project_id: Optional[int] = None,
+) -> Select:
+    if dialect_name == "postgresql":
+        # Matched through the GIN index on the tsvector expression
+        tsquery = func.websearch_to_tsquery(
+            literal_column(f"'{SEARCH_CONFIG}'::regconfig"), query
+        )
+        # ts_rank is a float4; as double precision it round-trips through the
+        # cursor exactly
+        rank = cast(func.ts_rank(task_search_document, tsquery), Float)
+        stmt = select(*columns, rank.label("rank")).where(
+            task_search_document.op("@@")(tsquery)
+        )
+    else:
+        # LIKE fallback: every term must appear in the title or description,
+        # and title matches rank higher
+        terms = query.split()[:MAX_SEARCH_TERMS]
+        rank = cast(
+            sum(
+                case((Task.title.icontains(term, autoescape=True), 2), else_=0)
+                + case((Task.description.icontains(term, autoescape=True), 1), else_=0)
+                for term in terms
+            ),
+            Float,
+        )
+        stmt = select(*columns, rank.label("rank")).where(
+            *(
+                Task.title.icontains(term, autoescape=True)
+                | Task.description.icontains(term, autoescape=True)
+                for term in terms
+            )
+        )
+
+    if project_id is not None:
+        stmt = stmt.where(Task.project_id == project_id)
+    # Keyset pagination over (rank, id), best match first
+    if after is not None:
+        stmt = stmt.where(tuple_(rank, Task.id) < tuple_(*after))
+    return stmt.order_by(rank.desc(), Task.id.desc()).limit(limit)
+
+
+def count_query(project_id: int) -> Select:
+    return select(func.count()).select_from(Task).where(Task.project_id == project_id)
+
+
+def counts_by_project_query(project_ids: List[int]) -> Select:
+    return (
+        select(Task.project_id, func.count())
+        .where(Task.project_id.in_(project_ids))
+        .group_by(Task.project_id)
+    )
+
+
+def ids_in_project_query(project_id: int, task_ids: Iterable[int]) -> Select:
+    return select(Task.id).where(
+        Task.project_id == project_id, Task.id.in_(list(task_ids))
+    )
+
+
+def touch_projects_query(project_ids: List[int], task_delta: int = 0) -> Update:
+    # Bump the revision used for conditional GETs and keep Project.task_count
+    # in step with inserts/deletes for O(1) limit checks
+    values = {"revision": Project.revision + 1, "updated_at": datetime.now()}
+    if task_delta:
+        values["task_count"] = Project.task_count + task_delta
+    return update(Project).where(Project.id.in_(project_ids)).values(**values)
+
+
+def task_rows(project_id: int, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "project_id": project_id,
+            "title": task["title"],
+            "description": task["description"],
+            "deadline": task.get("deadline"),
+        }
+        for task in tasks
+    ]
+
+
+def status_update_query(
+    project_id: int, task_ids: List[int], new_status: str, now: datetime
+) -> Update:
+    # Rows already in the target status are skipped, so closed_at is only
+    # stamped on transitions to done
+    values: Dict[str, Any] = {"status": new_status}
+    if new_status == "done":
+        values["closed_at"] = now
+    return (
+        update(Task)
+        .where(
+            Task.project_id == project_id,
+            Task.id.in_(task_ids),
+            Task.status != new_status,
+        )
+        .values(**values, version=Task.version + 1)
+        .returning(*Task.__table__.columns)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def status_changed_events(project_id: int, rows: Iterable[RowMapping]) -> Iterator[Event]:
+    return (
+        task_status_changed(
+            row["id"], project_id, row["status"], row["closed_at"], row["version"]
+        )
+        for row in rows
+    )
+
+
+def open_deadlines(rows: Iterable[RowMapping]) -> Iterator[Tuple[int, Optional[datetime]]]:
+    # Deadlines a status change may have reopened, for the scheduler
+    return ((row["id"], row["deadline"]) for row in rows if row["status"] != "done")
+
+
+def set_status(task: Task, new_status: str) -> str:
+    # Returns the previous status; closed_at is stamped when a task becomes done
+    old_status = task.status
+    task.status = new_status
+    if new_status == "done" and old_status != "done":
+        task.closed_at = datetime.now()
+    return old_status
+
+
+def overdue_ids_query(now: datetime, batch_size: Optional[int] = None) -> Select:
+    stmt = select(Task.id).where(
+        and_(
+            Task.deadline.is_not(None),
+            Task.deadline < now,
+            Task.status != "done",
+        )
+    )
+    if batch_size is not None:
+        stmt = stmt.limit(batch_size).with_for_update(skip_locked=True)
+    return stmt
+
+
+def close_overdue_query(now: datetime, batch_size: Optional[int] = None) -> Update:
+    # Set-based close: one UPDATE ... RETURNING id per batch, no ORM objects
+    return (
+        update(Task)
+        .where(Task.id.in_(overdue_ids_query(now, batch_size)))
+        .values(status="done", closed_at=now, version=Task.version + 1)
+        .returning(Task.id, Task.project_id, Task.version)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def closed_events(now: datetime, closed: Sequence[Row]) -> Iterator[Event]:
+    return (
+        task_status_changed(task_id, project_id, "done", now, version)
+        for task_id, project_id, version in closed
+    )
 
 
 class TaskRepository:
@@ -28,21 +243,99 @@ class TaskRepository:
         result = self.session.execute(stmt)
         return list(result.scalars().all())
 
-    def count_by_project_id(self, project_id: int) -> int:
-        return len(self.get_by_project_id(project_id))
-
-    def get_overdue_tasks(self) -> List[Task]:
-        now = datetime.now()
-        stmt = select(Task).where(
-            and_(
-                Task.deadline.is_not(None),
-                Task.deadline < now,
-                Task.status != "done",
-            )
+    def get_page_by_project_id(
+        self,
+        project_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        status: Optional[str] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+    ) -> List[Task]:
+        stmt = project_page_query(
+            select(Task), project_id, limit, after, status, deadline_from, deadline_to
         )
         result = self.session.execute(stmt)
         return list(result.scalars().all())
 
+    def get_row_page_by_project_id(
+        self,
+        columns: Sequence[Any],
+        project_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        status: Optional[str] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+    ) -> List[Row]:
+        # Same page as get_page_by_project_id, as plain rows of the given columns
+        stmt = project_page_query(
+            select(*columns), project_id, limit, after, status, deadline_from, deadline_to
+        )
+        result = self.session.execute(stmt)
+        return list(result.all())
+
+    def stream_by_project_id(
+        self,
+        columns: Sequence[Any],
+        project_id: int,
+        batch_size: int = 1000,
+        status: Optional[str] = None,
+    ) -> Iterator[Row]:
+        # Rows of the given columns over a server-side cursor (yield_per implies
+        # stream_results), so memory stays flat however many tasks there are
+        stmt = select(*columns).where(Task.project_id == project_id)
+        if status is not None:
+            stmt = stmt.where(Task.status == status)
+        stmt = stmt.order_by(Task.created_at, Task.id).execution_options(
+            yield_per=batch_size
+        )
+        result = self.session.execute(stmt)
+        yield from result
+
+    def search(
+        self,
+        columns: Sequence[Any],
+        query: str,
+        limit: int,
+        after: Optional[Tuple[float, int]] = None,
+        project_id: Optional[int] = None,
+    ) -> List[Row]:
+        # Rows of the given columns plus a "rank" column, best match first
+        dialect_name = self.session.get_bind().dialect.name
+        stmt = search_query(columns, dialect_name, query, limit, after, project_id)
+        result = self.session.execute(stmt)
+        return list(result.all())
+
+    def count_by_project_id(self, project_id: int) -> int:
+        result = self.session.execute(count_query(project_id))
+        return result.scalar_one()
+
+    def count_by_project_ids(self, project_ids: Iterable[int]) -> Dict[int, int]:
+        counts = {project_id: 0 for project_id in project_ids}
+        if not counts:
+            return counts
+
+        result = self.session.execute(counts_by_project_query(list(counts)))
+        counts.update({project_id: count for project_id, count in result.all()})
+        return counts
+
+    def _flush_versioned(self, task: Task) -> None:
+        # The UPDATE/DELETE matches on the version that was read; if another
+        # writer got there first it matches nothing and we report a conflict
+        task_id = task.id  # unreadable once the failed flush has expired it
+        try:
+            self.session.flush()
+        except StaleDataError:
+            raise ConcurrentModificationException("Task", task_id)
+
+    def _touch_projects(
+        self, project_ids: Iterable[int], task_delta: int = 0
+    ) -> None:
+        project_ids = list(project_ids)
+        if project_ids:
+            self.session.execute(touch_projects_query(project_ids, task_delta))
+
     def create(
         self,
         project_id: int,
@@ -58,31 +351,127 @@ class TaskRepository:
         )
         self.session.add(task)
         self.session.flush()  # Get the ID
+        self._touch_projects([project_id], task_delta=1)
+        record_events(self.session, [task_created(task)])
+        record_deadlines(self.session, [(task.id, task.deadline)])
         return task
 
+    def create_many(
+        self, project_id: int, tasks: List[Dict[str, Any]]
+    ) -> List[Task]:
+        # One multi-row INSERT ... RETURNING instead of a flush per task.
+        # Ordering RETURNING by parameters forces row-at-a-time inserts on some
+        # backends, so sort by the generated ids instead
+        result = self.session.scalars(
+            insert(Task).returning(Task), task_rows(project_id, tasks)
+        )
+        created = sorted(result.all(), key=lambda task: task.id)
+        self._touch_projects([project_id], task_delta=len(created))
+        record_events(self.session, (task_created(task) for task in created))
+        record_deadlines(self.session, ((task.id, task.deadline) for task in created))
+        return created
+
+    def insert_many(self, project_id: int, tasks: List[Dict[str, Any]]) -> int:
+        # executemany without RETURNING, for loads where the rows are not needed back
+        if not tasks:
+            return 0
+
+        rows = task_rows(project_id, tasks)
+        self.session.execute(insert(Task), rows)
+        self._touch_projects([project_id], task_delta=len(rows))
+        record_events(self.session, [tasks_imported(project_id, len(rows))])
+        record_deadline_refresh(self.session)
+        return len(rows)
+
+    def get_ids_in_project(
+        self, project_id: int, task_ids: Iterable[int]
+    ) -> Set[int]:
+        result = self.session.scalars(ids_in_project_query(project_id, task_ids))
+        return set(result.all())
+
+    def apply_statuses(
+        self, project_id: int, task_ids_by_status: Dict[str, List[int]]
+    ) -> List[RowMapping]:
+        # One UPDATE ... RETURNING per target status
+        now = datetime.now()
+        updated: List[RowMapping] = []
+        for new_status, task_ids in task_ids_by_status.items():
+            stmt = status_update_query(project_id, task_ids, new_status, now)
+            result = self.session.execute(stmt)
+            updated.extend(result.mappings().all())
+
+        if updated:
+            self._touch_projects([project_id])
+            record_events(self.session, status_changed_events(project_id, updated))
+            record_deadlines(self.session, open_deadlines(updated))
+        return updated
+
     def update_status(self, task_id: int, new_status: str) -> Task:
         task = self.get_by_id(task_id)
         if not task:
             raise EntityNotFoundException("Task", task_id)
 
-        old_status = task.status
-        task.status = new_status
-
-        # If marking as done, set closed_at
-        if new_status == "done" and old_status != "done":
-            task.closed_at = datetime.now()
+        return self.apply_status(task, new_status)
 
+    def apply_status(self, task: Task, new_status: str) -> Task:
+        old_status = set_status(task, new_status)
+        self._flush_versioned(task)
+        self._touch_projects([task.project_id])
+        if new_status != old_status:
+            record_events(
+                self.session,
+                [
+                    task_status_changed(
+                        task.id, task.project_id, new_status, task.closed_at, task.version
+                    )
+                ],
+            )
+            if new_status != "done":
+                record_deadlines(self.session, [(task.id, task.deadline)])
         return task
 
-    def close_overdue_task(self, task: Task) -> Task:
-        task.status = "done"
-        task.closed_at = datetime.now()
-        return task
+    def get_open_deadlines(
+        self,
+        limit: Optional[int] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+        changed_since: Optional[datetime] = None,
+    ) -> List[Tuple[datetime, int]]:
+        # (deadline, id) pairs of open tasks, soonest first; served by ix_tasks_open_deadline
+        stmt = select(Task.deadline, Task.id).where(
+            and_(Task.deadline.is_not(None), Task.status != "done")
+        )
+        if deadline_from is not None:
+            stmt = stmt.where(Task.deadline >= deadline_from)
+        if deadline_to is not None:
+            stmt = stmt.where(Task.deadline <= deadline_to)
+        if changed_since is not None:
+            stmt = stmt.where(Task.updated_at >= changed_since)
+        stmt = stmt.order_by(Task.deadline, Task.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = self.session.execute(stmt)
+        return [(deadline, task_id) for deadline, task_id in result.all()]
+
+    def close_overdue_batch(
+        self, now: datetime, batch_size: Optional[int] = None
+    ) -> List[int]:
+        result = self.session.execute(close_overdue_query(now, batch_size))
+        closed = result.all()
+        self._touch_projects({project_id for _, project_id, _ in closed})
+        record_events(self.session, closed_events(now, closed))
+        return [task_id for task_id, _, _ in closed]
 
     def delete(self, task_id: int) -> Task:
         task = self.get_by_id(task_id)
         if not task:
             raise EntityNotFoundException("Task", task_id)
 
+        return self.delete_instance(task)
+
+    def delete_instance(self, task: Task) -> Task:
         self.session.delete(task)
-        return task
\ No newline at end of file
+        self._flush_versioned(task)
+        self._touch_projects([task.project_id], task_delta=-1)
+        record_events(self.session, [task_deleted(task.id, task.project_id)])
+        return task
@@ -1,28 +1,64 @@
 import os
 import sys
-import uvicorn
+from typing import Optional
 
+import uvicorn
 
-def main():
-    """Run the FastAPI application with uvicorn."""
-    host = os.getenv("API_HOST", "127.0.0.1")
 
+def _int_setting(name: str, default: Optional[int]) -> Optional[int]:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
     try:
-        api_port = os.getenv("API_PORT", "8000")
-        port = int(api_port)
+        return int(value)
     except ValueError:
-        print(f"Error: API_PORT must be a valid integer, got '{api_port}'", file=sys.stderr)
+        print(f"Error: {name} must be a valid integer, got '{value}'", file=sys.stderr)
         sys.exit(1)
 
+
+def main():
+    """Run the FastAPI application with uvicorn."""
+    host = os.getenv("API_HOST", "127.0.0.1")
+    port = _int_setting("API_PORT", 8000)
+
     # Only enable reload in development (when API_ENV is not 'production')
     api_env = os.getenv("API_ENV", "development")
-    reload = api_env.lower() != "production"
+    production = api_env.lower() == "production"
+
+    if not production:
+        uvicorn.run(
+            "app.api.app:app",
+            host=host,
+            port=port,
+            reload=True,
+        )
+        return
+
+    # One worker process per core by default. Workers are started fresh rather
+    # than forked from a process holding connections, and each disposes its
+    # own pool on shutdown (see the app lifespan).
+    workers = _int_setting("API_WORKERS", os.cpu_count() or 1)
+    if workers > 1 and os.getenv("SCHEDULER_EMBEDDED", "false").lower() in ("1", "true", "yes"):
+        print(
+            "Warning: SCHEDULER_EMBEDDED runs a scheduler in every worker; "
+            "prefer a single todolist-scheduler process.",
+            file=sys.stderr,
+        )
 
     uvicorn.run(
         "app.api.app:app",
         host=host,
         port=port,
-        reload=reload,
+        workers=workers,
+        # "auto" picks uvloop and httptools when installed (uvicorn[standard])
+        loop=os.getenv("API_LOOP", "auto"),
+        http=os.getenv("API_HTTP", "auto"),
+        backlog=_int_setting("API_BACKLOG", 2048),
+        timeout_keep_alive=_int_setting("API_KEEPALIVE_SECONDS", 5),
+        timeout_graceful_shutdown=_int_setting("API_GRACEFUL_SHUTDOWN_SECONDS", 30),
+        limit_concurrency=_int_setting("API_LIMIT_CONCURRENCY", None),
+        access_log=os.getenv("API_ACCESS_LOG", "true").lower() in ("1", "true", "yes"),
+        proxy_headers=True,
     )
 
 
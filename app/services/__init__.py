@@ -1,2 +1,5 @@
 from app.services.project_service import ProjectService
 from app.services.task_service import TaskService
+from app.services.async_project_service import AsyncProjectService
+from app.services.async_task_service import AsyncTaskService
+from app.services.results import ServiceError, ServiceResult
@@ -0,0 +1,112 @@
+import os
+from datetime import datetime
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy import Row
+
+from app.exceptions import (
+    ConcurrentModificationException,
+    DuplicateEntityException,
+    EntityNotFoundException,
+)
+from app.models.project import Project
+from app.repositories.async_project_repository import AsyncProjectRepository
+from app.services.project_service import (
+    build_project_summaries,
+    duplicate_project,
+    project_changed,
+    project_conflict,
+    project_limit_reached,
+    validate_project,
+)
+from app.services.results import ServiceResult
+from app.services.task_service import TaskService, project_not_found
+
+load_dotenv()
+
+
+class AsyncProjectService:
+
+    def __init__(self, project_repository: AsyncProjectRepository):
+        self.project_repository = project_repository
+        self.max_projects = int(os.getenv("MAX_NUMBER_OF_PROJECTS", 10))
+
+    async def create_project(
+        self, name: str, description: str
+    ) -> ServiceResult[Project]:
+        invalid = validate_project(name, description)
+        if invalid:
+            return invalid
+
+        if await self.project_repository.count() >= self.max_projects:
+            return project_limit_reached(self.max_projects)
+
+        try:
+            project = await self.project_repository.create(name, description)
+            return ServiceResult.ok(
+                f"Project '{name}' created successfully. (ID: {project.id})", project
+            )
+        except DuplicateEntityException:
+            return duplicate_project()
+
+    async def get_all_projects(self) -> List[Project]:
+        return await self.project_repository.get_all()
+
+    async def get_projects_row_page(
+        self,
+        columns: Sequence[Any],
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[Row], bool]:
+        # Fetch one extra row to know whether another page exists
+        rows = await self.project_repository.get_row_page(columns, limit + 1, after)
+        return rows[:limit], len(rows) > limit
+
+    async def get_projects_page_with_tasks(
+        self,
+        project_columns: Sequence[Any],
+        task_columns: Sequence[Any],
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[Project], bool]:
+        projects = await self.project_repository.get_page_with_tasks(
+            project_columns, task_columns, limit + 1, after
+        )
+        return projects[:limit], len(projects) > limit
+
+    async def get_projects_summary(self) -> List[Dict[str, Any]]:
+        statuses = TaskService.valid_statuses
+        rows = await self.project_repository.get_summaries(statuses, datetime.now())
+        return build_project_summaries(rows, statuses)
+
+    async def get_projects_page_version(
+        self, limit: int, after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Row]:
+        # One row past the page as well, since it decides next_cursor
+        return await self.project_repository.get_page_versions(limit + 1, after)
+
+    async def get_projects_version(self) -> Tuple[int, Optional[int]]:
+        return await self.project_repository.get_list_version()
+
+    async def get_project_by_id(self, project_id: int) -> Optional[Project]:
+        return await self.project_repository.get_by_id(project_id)
+
+    async def delete_project(
+        self, project_id: int, expected_versions: Optional[Collection[int]] = None
+    ) -> ServiceResult[Project]:
+        if expected_versions is not None:
+            project = await self.project_repository.get_fresh(project_id)
+            if project is not None and project.version not in expected_versions:
+                return project_changed()
+
+        try:
+            project = await self.project_repository.delete(project_id)
+            return ServiceResult.ok(
+                f"Project '{project.name}' and all its tasks deleted successfully.",
+                project,
+            )
+        except EntityNotFoundException:
+            return project_not_found()
+        except ConcurrentModificationException:
+            return project_conflict()
@@ -0,0 +1,191 @@
+import os
+from datetime import datetime
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy import Row, RowMapping
+
+from app.exceptions import ConcurrentModificationException
+from app.models.task import Task
+from app.repositories.async_project_repository import AsyncProjectRepository
+from app.repositories.async_task_repository import AsyncTaskRepository
+from app.services.results import ServiceResult
+from app.services.task_service import (
+    VALID_STATUSES,
+    check_missing_tasks,
+    check_task,
+    group_status_changes,
+    order_by_request,
+    project_not_found,
+    task_conflict,
+    task_limit_reached,
+    tasks_limit_exceeded,
+    validate_status,
+    validate_task,
+    validate_tasks,
+)
+
+load_dotenv()
+
+
+class AsyncTaskService:
+
+    valid_statuses = VALID_STATUSES
+
+    def __init__(
+        self,
+        task_repository: AsyncTaskRepository,
+        project_repository: AsyncProjectRepository,
+    ):
+        self.task_repository = task_repository
+        self.project_repository = project_repository
+        self.max_tasks_per_project = int(
+            os.getenv("MAX_NUMBER_OF_TASKS_PER_PROJECT", 100)
+        )
+        # "counter" reads the maintained Project.task_count instead of COUNT(*)
+        self.task_count_mode = os.getenv("TASK_COUNT_MODE", "query").lower()
+
+    async def add_task(
+        self,
+        project_id: int,
+        title: str,
+        description: str,
+        deadline: Optional[datetime] = None,
+    ) -> ServiceResult[Task]:
+        invalid = validate_task(title, description)
+        if invalid:
+            return invalid
+
+        project = await self.project_repository.get_fresh(project_id)
+        if not project:
+            return project_not_found()
+
+        if self.task_count_mode == "counter":
+            task_count = project.task_count
+        else:
+            task_count = await self.task_repository.count_by_project_id(project_id)
+        if task_count >= self.max_tasks_per_project:
+            return task_limit_reached(self.max_tasks_per_project)
+
+        task = await self.task_repository.create(
+            project_id, title, description, deadline
+        )
+        return ServiceResult.ok(
+            f"Task '{title}' created successfully. (ID: {task.id})", task
+        )
+
+    async def add_tasks(
+        self, project_id: int, tasks: List[Dict[str, Any]]
+    ) -> ServiceResult[List[Task]]:
+        invalid = validate_tasks(tasks)
+        if invalid:
+            return invalid
+
+        project = await self.project_repository.get_fresh(project_id)
+        if not project:
+            return project_not_found()
+
+        # The per-project limit is checked once for the whole batch
+        if self.task_count_mode == "counter":
+            task_count = project.task_count
+        else:
+            task_count = await self.task_repository.count_by_project_id(project_id)
+        if task_count + len(tasks) > self.max_tasks_per_project:
+            return tasks_limit_exceeded(len(tasks), self.max_tasks_per_project)
+
+        created = await self.task_repository.create_many(project_id, tasks)
+        return ServiceResult.ok(f"{len(created)} task(s) created successfully.", created)
+
+    async def change_task_status(
+        self,
+        task_id: int,
+        new_status: str,
+        project_id: Optional[int] = None,
+        expected_versions: Optional[Collection[int]] = None,
+    ) -> ServiceResult[Task]:
+        invalid = validate_status(new_status)
+        if invalid:
+            return invalid
+
+        task = await self.task_repository.get_by_id(task_id)
+        failed = check_task(task, project_id, expected_versions)
+        if failed:
+            return failed
+
+        old_status = task.status
+        try:
+            await self.task_repository.apply_status(task, new_status)
+        except ConcurrentModificationException:
+            return task_conflict()
+        return ServiceResult.ok(
+            f"Task status changed from '{old_status}' to '{new_status}'.", task
+        )
+
+    async def change_task_statuses(
+        self, project_id: int, changes: Sequence[Tuple[int, str]]
+    ) -> ServiceResult[List[RowMapping]]:
+        grouped = group_status_changes(changes)
+        if not grouped.success:
+            return grouped
+
+        project = await self.project_repository.get_fresh(project_id)
+        if not project:
+            return project_not_found()
+
+        task_ids = [task_id for task_id, _ in changes]
+        found = await self.task_repository.get_ids_in_project(project_id, task_ids)
+        missing = check_missing_tasks(task_ids, found)
+        if missing:
+            return missing
+
+        updated = await self.task_repository.apply_statuses(
+            project_id, grouped.entity
+        )
+        updated = order_by_request(updated, task_ids)
+        return ServiceResult.ok(f"{len(updated)} task(s) changed status.", updated)
+
+    async def get_tasks_by_project(self, project_id: int) -> List[Task]:
+        return await self.task_repository.get_by_project_id(project_id)
+
+    async def get_tasks_version(self, project_id: int) -> Optional[Row]:
+        return await self.project_repository.get_task_list_version(project_id)
+
+    async def get_tasks_row_page(
+        self,
+        columns: Sequence[Any],
+        project_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        status: Optional[str] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+    ) -> Tuple[List[Row], bool]:
+        # Fetch one extra row to know whether another page exists
+        rows = await self.task_repository.get_row_page_by_project_id(
+            columns, project_id, limit + 1, after, status, deadline_from, deadline_to
+        )
+        return rows[:limit], len(rows) > limit
+
+    async def delete_task(
+        self,
+        task_id: int,
+        project_id: Optional[int] = None,
+        expected_versions: Optional[Collection[int]] = None,
+    ) -> ServiceResult[Task]:
+        task = await self.task_repository.get_by_id(task_id)
+        failed = check_task(task, project_id, expected_versions)
+        if failed:
+            return failed
+
+        try:
+            await self.task_repository.delete_instance(task)
+        except ConcurrentModificationException:
+            return task_conflict()
+        return ServiceResult.ok(f"Task '{task.title}' deleted successfully.", task)
+
+    async def close_overdue_tasks(self) -> int:
+        closed_ids = await self.task_repository.close_overdue_batch(datetime.now())
+        return len(closed_ids)
+
+    async def close_overdue_batch(self, now: datetime, batch_size: int) -> List[int]:
+        return await self.task_repository.close_overdue_batch(now, batch_size)
@@ -1,9 +1,12 @@
 import os
-from typing import List, Optional, Tuple
+from datetime import datetime
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple
 
 from dotenv import load_dotenv
+from sqlalchemy import Row
 
 from app.exceptions import (
+    ConcurrentModificationException,
     DuplicateEntityException,
     EntityNotFoundException,
     MaxLimitReachedException,
@@ -11,47 +14,155 @@ from app.exceptions import (
 )
 from app.models.project import Project
 from app.repositories.project_repository import ProjectRepository
+from app.services.results import ServiceError, ServiceResult
+from app.services.task_service import TaskService, project_not_found
 
 load_dotenv()
 
 
+def build_project_summaries(
+    rows: Sequence[Row], statuses: Sequence[str]
+) -> List[Dict[str, Any]]:
+    summaries = []
+    for row in rows:
+        status_counts = {status: row._mapping[f"status_{status}"] for status in statuses}
+        summaries.append(
+            {
+                "id": row.id,
+                "name": row.name,
+                "total": sum(status_counts.values()),
+                "status_counts": status_counts,
+                "overdue": row.overdue,
+                "next_deadline": row.next_deadline,
+            }
+        )
+    return summaries
+
+
+def validate_project(name: str, description: str) -> Optional[ServiceResult]:
+    if len(name) > 30:
+        return ServiceResult.fail(
+            ServiceError.INVALID,
+            "Error: Project name cannot exceed 30 characters.",
+        )
+
+    if len(description) > 150:
+        return ServiceResult.fail(
+            ServiceError.INVALID,
+            "Error: Project description cannot exceed 150 characters.",
+        )
+    return None
+
+
+def project_limit_reached(max_projects: int) -> ServiceResult:
+    return ServiceResult.fail(
+        ServiceError.LIMIT_REACHED,
+        f"Error: Maximum number of projects ({max_projects}) reached.",
+    )
+
+
+def duplicate_project() -> ServiceResult:
+    return ServiceResult.fail(
+        ServiceError.DUPLICATE,
+        "Error: A project with this name already exists.",
+    )
+
+
+def project_changed() -> ServiceResult:
+    return ServiceResult.fail(
+        ServiceError.PRECONDITION_FAILED,
+        "Error: Project has changed since it was read.",
+    )
+
+
+def project_conflict() -> ServiceResult:
+    return ServiceResult.fail(
+        ServiceError.CONFLICT,
+        "Error: Project was modified by another request. Reload it and retry.",
+    )
+
+
 class ProjectService:
 
     def __init__(self, project_repository: ProjectRepository):
         self.project_repository = project_repository
         self.max_projects = int(os.getenv("MAX_NUMBER_OF_PROJECTS", 10))
 
-    def create_project(self, name: str, description: str) -> Tuple[bool, str]:
-        if len(name) > 30:
-            return False, "Error: Project name cannot exceed 30 characters."
-
-        if len(description) > 150:
-            return False, "Error: Project description cannot exceed 150 characters."
+    def create_project(
+        self, name: str, description: str
+    ) -> ServiceResult[Project]:
+        invalid = validate_project(name, description)
+        if invalid:
+            return invalid
 
         if self.project_repository.count() >= self.max_projects:
-            return (
-                False,
-                f"Error: Maximum number of projects ({self.max_projects}) reached.",
-            )
+            return project_limit_reached(self.max_projects)
 
         try:
             project = self.project_repository.create(name, description)
-            return True, f"Project '{name}' created successfully. (ID: {project.id})"
+            return ServiceResult.ok(
+                f"Project '{name}' created successfully. (ID: {project.id})", project
+            )
         except DuplicateEntityException:
-            return False, "Error: A project with this name already exists."
+            return duplicate_project()
 
     def get_all_projects(self) -> List[Project]:
         return self.project_repository.get_all()
 
+    def get_projects_row_page(
+        self,
+        columns: Sequence[Any],
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[Row], bool]:
+        # Fetch one extra row to know whether another page exists
+        rows = self.project_repository.get_row_page(columns, limit + 1, after)
+        return rows[:limit], len(rows) > limit
+
+    def get_projects_page_with_tasks(
+        self,
+        project_columns: Sequence[Any],
+        task_columns: Sequence[Any],
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[Project], bool]:
+        projects = self.project_repository.get_page_with_tasks(
+            project_columns, task_columns, limit + 1, after
+        )
+        return projects[:limit], len(projects) > limit
+
+    def get_projects_summary(self) -> List[Dict[str, Any]]:
+        statuses = TaskService.valid_statuses
+        rows = self.project_repository.get_summaries(statuses, datetime.now())
+        return build_project_summaries(rows, statuses)
+
+    def get_projects_page_version(
+        self, limit: int, after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Row]:
+        # One row past the page as well, since it decides next_cursor
+        return self.project_repository.get_page_versions(limit + 1, after)
+
+    def get_projects_version(self) -> Tuple[int, Optional[int]]:
+        return self.project_repository.get_list_version()
+
     def get_project_by_id(self, project_id: int) -> Optional[Project]:
         return self.project_repository.get_by_id(project_id)
 
-    def delete_project(self, project_id: int) -> Tuple[bool, str]:
+    def delete_project(
+        self, project_id: int, expected_versions: Optional[Collection[int]] = None
+    ) -> ServiceResult[Project]:
+        if expected_versions is not None:
+            project = self.project_repository.get_fresh(project_id)
+            if project is not None and project.version not in expected_versions:
+                return project_changed()
+
         try:
             project = self.project_repository.delete(project_id)
-            return (
-                True,
+            return ServiceResult.ok(
                 f"Project '{project.name}' and all its tasks deleted successfully.",
+                project,
             )
         except EntityNotFoundException:
-            return False, "Error: Project with this ID not found."
+            return project_not_found()
+        except ConcurrentModificationException:
+            return project_conflict()
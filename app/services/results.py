@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Generic, Iterator, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class ServiceError(str, Enum):
+
+    NOT_FOUND = "not_found"
+    INVALID = "invalid"
+    LIMIT_REACHED = "limit_reached"
+    DUPLICATE = "duplicate"
+    PRECONDITION_FAILED = "precondition_failed"
+    CONFLICT = "conflict"
+
+
+@dataclass
+class ServiceResult(Generic[T]):
+
+    success: bool
+    message: str
+    entity: Optional[T] = None
+    error: Optional[ServiceError] = None
+
+    @classmethod
+    def ok(cls, message: str, entity: T) -> "ServiceResult[T]":
+        return cls(True, message, entity)
+
+    @classmethod
+    def fail(cls, error: ServiceError, message: str) -> "ServiceResult[T]":
+        return cls(False, message, error=error)
+
+    def __iter__(self) -> Iterator[Union[bool, str]]:
+        # Unpacks as (success, message) like the tuples services used to return
+        return iter((self.success, self.message))
@@ -0,0 +1,187 @@
+import csv
+import io
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from dotenv import load_dotenv
+from pydantic import BaseModel, Field, ValidationError
+
+from app.db.session import SessionLocal
+from app.repositories.cached import get_project_repository, get_task_repository
+from app.services.results import ServiceError, ServiceResult
+from app.services.task_service import TaskService
+
+load_dotenv()
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+# (row number, parsed record or parse error message)
+Record = Tuple[int, Union[Dict[str, Any], str]]
+
+# Bytes that are not valid UTF-8 decode to lone surrogates under
+# surrogateescape, which valid text can never contain
+INVALID_TEXT = re.compile("[\udc80-\udcff]")
+INVALID_TEXT_ERROR = "Invalid text: not UTF-8 encoded"
+
+
+class TaskRecord(BaseModel):
+
+    # One imported row; the limits match TaskCreate and the tasks columns
+    title: str = Field(..., min_length=1, max_length=30)
+    description: str = Field(..., min_length=1, max_length=150)
+    deadline: Optional[datetime] = None
+
+
+@dataclass
+class ImportReport:
+
+    imported: int = 0
+    failed: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    max_errors: int = 1000
+
+    def add_error(self, row: int, error: str) -> None:
+        # Every rejected row is counted, but only the first max_errors are listed
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"row": row, "error": error})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"imported": self.imported, "failed": self.failed, "errors": self.errors}
+
+
+def text_stream(binary: BinaryIO) -> TextIO:
+    # Undecodable bytes are kept (as surrogates) so the readers can reject
+    # just the rows containing them instead of failing the whole import
+    return io.TextIOWrapper(
+        binary, encoding="utf-8-sig", errors="surrogateescape", newline=""
+    )
+
+
+def read_ndjson(stream: TextIO) -> Iterator[Record]:
+    for row, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        if INVALID_TEXT.search(line):
+            yield row, INVALID_TEXT_ERROR
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield row, "Invalid record: expected a JSON object"
+            continue
+        yield row, record
+
+
+def read_csv(stream: TextIO) -> Iterator[Record]:
+    # Row numbers count the header as row 1, as spreadsheets do
+    reader = csv.DictReader(stream)
+    for record in reader:
+        row = reader.line_num
+        if None in record:
+            yield row, "Invalid record: more values than header columns"
+            continue
+        if any(value and INVALID_TEXT.search(value) for value in record.values()):
+            yield row, INVALID_TEXT_ERROR
+            continue
+        # Empty cells mean "not set", e.g. a task without a deadline
+        yield row, {key: value for key, value in record.items() if value != ""}
+
+
+def read_records(stream: TextIO, import_format: str) -> Iterator[Record]:
+    if import_format == "csv":
+        return read_csv(stream)
+    return read_ndjson(stream)
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+def _chunks(records: Iterable[Record], size: int) -> Iterator[List[Record]]:
+    records = iter(records)
+    while chunk := list(islice(records, size)):
+        yield chunk
+
+
+def import_tasks(
+    stream: TextIO,
+    project_id: int,
+    import_format: str = "ndjson",
+    chunk_size: Optional[int] = None,
+) -> ServiceResult[ImportReport]:
+    # Reads, validates and inserts one chunk at a time and commits after each,
+    # so a bad row only rejects itself and memory does not grow with the file
+    chunk_size = chunk_size or int(os.getenv("IMPORT_CHUNK_SIZE", 1000))
+    report = ImportReport(max_errors=int(os.getenv("IMPORT_MAX_ERRORS", 1000)))
+
+    session = SessionLocal()
+    try:
+        task_service = TaskService(
+            get_task_repository(session), get_project_repository(session)
+        )
+        if task_service.project_repository.get_fresh(project_id) is None:
+            return ServiceResult.fail(
+                ServiceError.NOT_FOUND, "Error: Project with this ID not found."
+            )
+
+        for chunk in _chunks(read_records(stream, import_format), chunk_size):
+            valid: List[Tuple[int, Dict[str, Any]]] = []
+            for row, record in chunk:
+                if isinstance(record, str):
+                    report.add_error(row, record)
+                    continue
+                try:
+                    task = TaskRecord.model_validate(record)
+                except ValidationError as e:
+                    report.add_error(row, _validation_message(e))
+                    continue
+                valid.append((row, task.model_dump()))
+
+            if not valid:
+                continue
+
+            result = task_service.import_tasks(project_id, [task for _, task in valid])
+            if not result.success:
+                session.rollback()
+                return ServiceResult.fail(result.error, result.message)
+            session.commit()
+
+            report.imported += result.entity
+            for row, _ in valid[result.entity:]:
+                report.add_error(
+                    row,
+                    f"Maximum number of tasks per project ({task_service.max_tasks_per_project}) reached.",
+                )
+
+        return ServiceResult.ok(
+            f"{report.imported} task(s) imported, {report.failed} row(s) rejected.",
+            report,
+        )
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
@@ -1,19 +1,148 @@
 import os
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple
 
 from dotenv import load_dotenv
+from sqlalchemy import Row, RowMapping
 
-from app.exceptions import EntityNotFoundException
+from app.exceptions import ConcurrentModificationException
 from app.models.task import Task
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.task_repository import TaskRepository
+from app.services.results import ServiceError, ServiceResult
 
 load_dotenv()
 
+VALID_STATUSES = ["todo", "doing", "done"]
+
+
+def project_not_found() -> ServiceResult:
+    return ServiceResult.fail(
+        ServiceError.NOT_FOUND, "Error: Project with this ID not found."
+    )
+
+
+def task_conflict() -> ServiceResult:
+    return ServiceResult.fail(
+        ServiceError.CONFLICT,
+        "Error: Task was modified by another request. Reload it and retry.",
+    )
+
+
+def validate_task(title: str, description: str) -> Optional[ServiceResult]:
+    if len(title) > 30:
+        return ServiceResult.fail(
+            ServiceError.INVALID, "Error: Task title cannot exceed 30 characters."
+        )
+
+    if len(description) > 150:
+        return ServiceResult.fail(
+            ServiceError.INVALID,
+            "Error: Task description cannot exceed 150 characters.",
+        )
+    return None
+
+
+def validate_tasks(tasks: List[Dict[str, Any]]) -> Optional[ServiceResult]:
+    for index, task in enumerate(tasks):
+        if len(task["title"]) > 30:
+            return ServiceResult.fail(
+                ServiceError.INVALID,
+                f"Error: Task #{index + 1} title cannot exceed 30 characters.",
+            )
+        if len(task["description"]) > 150:
+            return ServiceResult.fail(
+                ServiceError.INVALID,
+                f"Error: Task #{index + 1} description cannot exceed 150 characters.",
+            )
+    return None
+
+
+def validate_status(new_status: str) -> Optional[ServiceResult]:
+    if new_status not in VALID_STATUSES:
+        return ServiceResult.fail(
+            ServiceError.INVALID,
+            f"Error: Status '{new_status}' is invalid. Valid statuses: {', '.join(VALID_STATUSES)}",
+        )
+    return None
+
+
+def group_status_changes(
+    changes: Sequence[Tuple[int, str]]
+) -> ServiceResult[Dict[str, List[int]]]:
+    # Validated up front so the batch is applied all-or-nothing
+    task_ids_by_status: Dict[str, List[int]] = {}
+    for index, (task_id, new_status) in enumerate(changes):
+        if new_status not in VALID_STATUSES:
+            return ServiceResult.fail(
+                ServiceError.INVALID,
+                f"Error: Change #{index + 1} status '{new_status}' is invalid. Valid statuses: {', '.join(VALID_STATUSES)}",
+            )
+        task_ids_by_status.setdefault(new_status, []).append(task_id)
+
+    task_ids = [task_id for task_id, _ in changes]
+    if len(set(task_ids)) != len(task_ids):
+        return ServiceResult.fail(
+            ServiceError.INVALID, "Error: Each task can only be listed once."
+        )
+    return ServiceResult.ok("", task_ids_by_status)
+
+
+def check_missing_tasks(
+    task_ids: List[int], found: Collection[int]
+) -> Optional[ServiceResult]:
+    missing = [task_id for task_id in task_ids if task_id not in found]
+    if missing:
+        return ServiceResult.fail(
+            ServiceError.NOT_FOUND,
+            f"Error: Task(s) not found in this project: {', '.join(map(str, missing))}.",
+        )
+    return None
+
+
+def check_task(
+    task: Optional[Task],
+    project_id: Optional[int] = None,
+    expected_versions: Optional[Collection[int]] = None,
+) -> Optional[ServiceResult]:
+    if not task or (project_id is not None and task.project_id != project_id):
+        return ServiceResult.fail(
+            ServiceError.NOT_FOUND, "Error: Task with this ID not found."
+        )
+
+    if expected_versions is not None and task.version not in expected_versions:
+        return ServiceResult.fail(
+            ServiceError.PRECONDITION_FAILED,
+            "Error: Task has changed since it was read.",
+        )
+    return None
+
+
+def task_limit_reached(max_tasks: int) -> ServiceResult:
+    return ServiceResult.fail(
+        ServiceError.LIMIT_REACHED,
+        f"Error: Maximum number of tasks per project ({max_tasks}) reached.",
+    )
+
+
+def tasks_limit_exceeded(count: int, max_tasks: int) -> ServiceResult:
+    return ServiceResult.fail(
+        ServiceError.LIMIT_REACHED,
+        f"Error: Adding {count} task(s) would exceed the maximum number of tasks per project ({max_tasks}).",
+    )
+
+
+def order_by_request(
+    updated: List[RowMapping], task_ids: List[int]
+) -> List[RowMapping]:
+    order = {task_id: index for index, task_id in enumerate(task_ids)}
+    return sorted(updated, key=lambda row: order[row["id"]])
+
 
 class TaskService:
 
+    valid_statuses = VALID_STATUSES
+
     def __init__(
         self,
         task_repository: TaskRepository,
@@ -24,7 +153,8 @@ class TaskService:
         self.max_tasks_per_project = int(
             os.getenv("MAX_NUMBER_OF_TASKS_PER_PROJECT", 100)
         )
-        self.valid_statuses = ["todo", "doing", "done"]
+        # "counter" reads the maintained Project.task_count instead of COUNT(*)
+        self.task_count_mode = os.getenv("TASK_COUNT_MODE", "query").lower()
 
     def add_task(
         self,
@@ -32,57 +162,166 @@ class TaskService:
         title: str,
         description: str,
         deadline: Optional[datetime] = None,
-    ) -> Tuple[bool, str]:
-        if len(title) > 30:
-            return False, "Error: Task title cannot exceed 30 characters."
+    ) -> ServiceResult[Task]:
+        invalid = validate_task(title, description)
+        if invalid:
+            return invalid
 
-        if len(description) > 150:
-            return False, "Error: Task description cannot exceed 150 characters."
-
-        project = self.project_repository.get_by_id(project_id)
+        project = self.project_repository.get_fresh(project_id)
         if not project:
-            return False, "Error: Project with this ID not found."
+            return project_not_found()
 
-        task_count = self.task_repository.count_by_project_id(project_id)
+        if self.task_count_mode == "counter":
+            task_count = project.task_count
+        else:
+            task_count = self.task_repository.count_by_project_id(project_id)
         if task_count >= self.max_tasks_per_project:
-            return (
-                False,
-                f"Error: Maximum number of tasks per project ({self.max_tasks_per_project}) reached.",
-            )
+            return task_limit_reached(self.max_tasks_per_project)
 
         task = self.task_repository.create(project_id, title, description, deadline)
-        return True, f"Task '{title}' created successfully. (ID: {task.id})"
+        return ServiceResult.ok(
+            f"Task '{title}' created successfully. (ID: {task.id})", task
+        )
 
-    def change_task_status(self, task_id: int, new_status: str) -> Tuple[bool, str]:
-        if new_status not in self.valid_statuses:
-            return (
-                False,
-                f"Error: Status '{new_status}' is invalid. Valid statuses: {', '.join(self.valid_statuses)}",
-            )
+    def add_tasks(
+        self, project_id: int, tasks: List[Dict[str, Any]]
+    ) -> ServiceResult[List[Task]]:
+        invalid = validate_tasks(tasks)
+        if invalid:
+            return invalid
+
+        project = self.project_repository.get_fresh(project_id)
+        if not project:
+            return project_not_found()
+
+        # The per-project limit is checked once for the whole batch
+        if self.task_count_mode == "counter":
+            task_count = project.task_count
+        else:
+            task_count = self.task_repository.count_by_project_id(project_id)
+        if task_count + len(tasks) > self.max_tasks_per_project:
+            return tasks_limit_exceeded(len(tasks), self.max_tasks_per_project)
+
+        created = self.task_repository.create_many(project_id, tasks)
+        return ServiceResult.ok(f"{len(created)} task(s) created successfully.", created)
+
+    def import_tasks(
+        self, project_id: int, tasks: List[Dict[str, Any]]
+    ) -> ServiceResult[int]:
+        # Unlike add_tasks, inserts as many rows as the project limit allows;
+        # the entity is how many of the leading tasks were written
+        project = self.project_repository.get_fresh(project_id)
+        if not project:
+            return project_not_found()
+
+        if self.task_count_mode == "counter":
+            task_count = project.task_count
+        else:
+            task_count = self.task_repository.count_by_project_id(project_id)
+        capacity = max(self.max_tasks_per_project - task_count, 0)
+
+        imported = self.task_repository.insert_many(project_id, tasks[:capacity])
+        return ServiceResult.ok(f"{imported} task(s) imported.", imported)
+
+    def change_task_status(
+        self,
+        task_id: int,
+        new_status: str,
+        project_id: Optional[int] = None,
+        expected_versions: Optional[Collection[int]] = None,
+    ) -> ServiceResult[Task]:
+        invalid = validate_status(new_status)
+        if invalid:
+            return invalid
 
+        task = self.task_repository.get_by_id(task_id)
+        failed = check_task(task, project_id, expected_versions)
+        if failed:
+            return failed
+
+        old_status = task.status
         try:
-            task = self.task_repository.get_by_id(task_id)
-            if not task:
-                return False, "Error: Task with this ID not found."
+            self.task_repository.apply_status(task, new_status)
+        except ConcurrentModificationException:
+            return task_conflict()
+        return ServiceResult.ok(
+            f"Task status changed from '{old_status}' to '{new_status}'.", task
+        )
+
+    def change_task_statuses(
+        self, project_id: int, changes: Sequence[Tuple[int, str]]
+    ) -> ServiceResult[List[RowMapping]]:
+        grouped = group_status_changes(changes)
+        if not grouped.success:
+            return grouped
+
+        project = self.project_repository.get_fresh(project_id)
+        if not project:
+            return project_not_found()
+
+        task_ids = [task_id for task_id, _ in changes]
+        found = self.task_repository.get_ids_in_project(project_id, task_ids)
+        missing = check_missing_tasks(task_ids, found)
+        if missing:
+            return missing
 
-            old_status = task.status
-            self.task_repository.update_status(task_id, new_status)
-            return True, f"Task status changed from '{old_status}' to '{new_status}'."
-        except EntityNotFoundException:
-            return False, "Error: Task with this ID not found."
+        updated = self.task_repository.apply_statuses(project_id, grouped.entity)
+        updated = order_by_request(updated, task_ids)
+        return ServiceResult.ok(f"{len(updated)} task(s) changed status.", updated)
 
     def get_tasks_by_project(self, project_id: int) -> List[Task]:
         return self.task_repository.get_by_project_id(project_id)
 
-    def delete_task(self, task_id: int) -> Tuple[bool, str]:
+    def get_tasks_version(self, project_id: int) -> Optional[Row]:
+        return self.project_repository.get_task_list_version(project_id)
+
+    def get_tasks_row_page(
+        self,
+        columns: Sequence[Any],
+        project_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        status: Optional[str] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+    ) -> Tuple[List[Row], bool]:
+        # Fetch one extra row to know whether another page exists
+        rows = self.task_repository.get_row_page_by_project_id(
+            columns, project_id, limit + 1, after, status, deadline_from, deadline_to
+        )
+        return rows[:limit], len(rows) > limit
+
+    def search_tasks(
+        self,
+        columns: Sequence[Any],
+        query: str,
+        limit: int,
+        after: Optional[Tuple[float, int]] = None,
+        project_id: Optional[int] = None,
+    ) -> Tuple[List[Row], bool]:
+        rows = self.task_repository.search(columns, query, limit + 1, after, project_id)
+        return rows[:limit], len(rows) > limit
+
+    def delete_task(
+        self,
+        task_id: int,
+        project_id: Optional[int] = None,
+        expected_versions: Optional[Collection[int]] = None,
+    ) -> ServiceResult[Task]:
+        task = self.task_repository.get_by_id(task_id)
+        failed = check_task(task, project_id, expected_versions)
+        if failed:
+            return failed
+
         try:
-            task = self.task_repository.delete(task_id)
-            return True, f"Task '{task.title}' deleted successfully."
-        except EntityNotFoundException:
-            return False, "Error: Task with this ID not found."
+            self.task_repository.delete_instance(task)
+        except ConcurrentModificationException:
+            return task_conflict()
+        return ServiceResult.ok(f"Task '{task.title}' deleted successfully.", task)
 
     def close_overdue_tasks(self) -> int:
-        overdue_tasks = self.task_repository.get_overdue_tasks()
-        for task in overdue_tasks:
-            self.task_repository.close_overdue_task(task)
-        return len(overdue_tasks)
+        closed_ids = self.task_repository.close_overdue_batch(datetime.now())
+        return len(closed_ids)
+
+    def close_overdue_batch(self, now: datetime, batch_size: int) -> List[int]:
+        return self.task_repository.close_overdue_batch(now, batch_size)
@@ -0,0 +1,90 @@
+import os
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+def configure_database(database_url: str = "") -> str:
+    # Must run before anything imports app.db.session
+    if not database_url:
+        handle, path = tempfile.mkstemp(prefix="todolist-bench-", suffix=".db")
+        os.close(handle)
+        database_url = f"sqlite:///{path}"
+    os.environ["DATABASE_URL"] = database_url
+    return database_url
+
+
+def create_schema() -> None:
+    import app.models  # noqa: F401 - registers the mappers
+    from app.db.base import Base
+    from app.db.session import SessionLocal
+
+    session = SessionLocal()
+    try:
+        bind = session.get_bind()
+        Base.metadata.drop_all(bind)
+        Base.metadata.create_all(bind)
+    finally:
+        session.close()
+
+
+class StatementCounter:
+
+    def __init__(self):
+        self.statements: List[str] = []
+        self._lock = threading.Lock()
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        with self._lock:
+            self.statements.append(statement)
+
+    @contextmanager
+    def counting(self) -> Iterator["StatementCounter"]:
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+
+        self.statements = []
+        event.listen(Engine, "before_cursor_execute", self._record)
+        try:
+            yield self
+        finally:
+            event.remove(Engine, "before_cursor_execute", self._record)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@contextmanager
+def timed(samples: List[float]) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        samples.append(time.perf_counter() - start)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean_ms": statistics.mean(ordered) * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[max(0, round(len(ordered) * 0.95) - 1)] * 1000,
+        "min_ms": ordered[0] * 1000,
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,53 @@
+"""Compare two benchmark reports from python -m benchmarks.suite.
+
+Flags a regression when a result's median latency grows by more than
+--threshold (relative) or it issues more SQL statements than before, and exits
+non-zero if any regression is found.
+
+Usage: python -m benchmarks.compare BASELINE.json CANDIDATE.json [--threshold 0.2]
+"""
+import argparse
+import json
+import sys
+
+
+def compare(baseline: dict, candidate: dict, threshold: float) -> int:
+    regressions = 0
+    print(f"{'benchmark':<45} {'base ms':>9} {'new ms':>9} {'change':>8} {'stmts':>9}")
+    for name, new in candidate["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            print(f"{name:<45} {'-':>9} {new['median_ms']:>9.2f} {'new':>8}")
+            continue
+
+        change = new["median_ms"] / old["median_ms"] - 1 if old["median_ms"] else 0.0
+        statements = f"{old['statements']:g}->{new['statements']:g}"
+        regressed = change > threshold or new["statements"] > old["statements"]
+        regressions += regressed
+        print(
+            f"{name:<45} {old['median_ms']:>9.2f} {new['median_ms']:>9.2f} "
+            f"{change:>+8.1%} {statements:>9}{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    with open(args.candidate) as handle:
+        candidate = json.load(handle)
+
+    regressions = compare(baseline, candidate, args.threshold)
+    if regressions:
+        print(f"{regressions} regression(s) above {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Check that GET /projects/?include=tasks runs a constant number of statements.
+
+Compares the statement count of the endpoint against walking Project.tasks
+lazily (one query per project) as the number of projects grows, and exits
+non-zero if the endpoint's count is not the same for every project count.
+
+Usage: python -m benchmarks.eager_loading [--projects 5 20 80] [--tasks-per-project N] [--database-url URL]
+"""
+import argparse
+import json
+import os
+import sys
+
+from benchmarks.common import StatementCounter, configure_database, create_schema
+
+
+def seed(projects: int, tasks_per_project: int) -> None:
+    from app.db.session import SessionLocal
+    from app.repositories.project_repository import ProjectRepository
+    from app.repositories.task_repository import TaskRepository
+
+    session = SessionLocal()
+    try:
+        project_repository = ProjectRepository(session)
+        task_repository = TaskRepository(session)
+        for i in range(projects):
+            project = project_repository.create(f"bench {i}", "benchmark")
+            task_repository.insert_many(
+                project.id,
+                [
+                    {"title": f"task {j}", "description": "benchmark task"}
+                    for j in range(tasks_per_project)
+                ],
+            )
+        session.commit()
+    finally:
+        session.close()
+
+
+def lazy_walk() -> None:
+    from app.db.session import SessionLocal
+    from app.repositories.project_repository import ProjectRepository
+
+    session = SessionLocal()
+    try:
+        for project in ProjectRepository(session).get_all():
+            list(project.tasks)
+    finally:
+        session.close()
+
+
+def run(project_counts, tasks_per_project: int) -> dict:
+    from fastapi.testclient import TestClient
+
+    from app.api.app import app
+
+    client = TestClient(app)
+    counter = StatementCounter()
+    results = {}
+    for projects in project_counts:
+        create_schema()
+        seed(projects, tasks_per_project)
+
+        with counter.counting():
+            response = client.get("/api/v1/projects/?include=tasks&limit=1000")
+        assert response.status_code == 200, response.text
+        assert len(response.json()["items"]) == projects
+        endpoint = counter.count
+
+        with counter.counting():
+            lazy_walk()
+        results[projects] = {"include_tasks": endpoint, "lazy_walk": counter.count}
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, nargs="+", default=[5, 20, 80])
+    parser.add_argument("--tasks-per-project", type=int, default=10)
+    parser.add_argument("--database-url", default="")
+    args = parser.parse_args()
+
+    configure_database(args.database_url)
+    os.environ["MAX_NUMBER_OF_PROJECTS"] = str(max(args.projects))
+    results = run(args.projects, args.tasks_per_project)
+    print(json.dumps(results, indent=2))
+
+    counts = {result["include_tasks"] for result in results.values()}
+    if len(counts) != 1:
+        print("FAIL: statements per include=tasks request grow with project count")
+        sys.exit(1)
+    print(f"OK: {counts.pop()} statement(s) per request regardless of project count")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Compare the ORM + response_model path with the row fast path for task lists.
+
+Usage: python -m benchmarks.list_serialization [--sizes 1000 10000] [--iterations N] [--database-url URL]
+"""
+import argparse
+import json
+import statistics
+
+from benchmarks.common import configure_database, create_schema, timed
+
+
+def seed(size: int) -> int:
+    from app.db.session import SessionLocal
+    from app.repositories.project_repository import ProjectRepository
+    from app.repositories.task_repository import TaskRepository
+
+    session = SessionLocal()
+    try:
+        project = ProjectRepository(session).create(f"bench {size}", "benchmark")
+        TaskRepository(session).insert_many(
+            project.id,
+            [{"title": f"task {i}", "description": "benchmark task"} for i in range(size)],
+        )
+        session.commit()
+        return project.id
+    finally:
+        session.close()
+
+
+def run(sizes, iterations: int) -> dict:
+    from pydantic import TypeAdapter
+
+    from app.api.v1.schemas import TaskPage, TaskResponse
+    from app.api.v1.serialization import PydanticJSONResponse, response_columns
+    from app.db.session import SessionLocal
+    from app.models.task import Task
+    from app.repositories.task_repository import TaskRepository
+
+    create_schema()
+    page_adapter = TypeAdapter(TaskPage)
+    columns = response_columns(Task, TaskResponse)
+
+    def orm_path(project_id: int, size: int) -> bytes:
+        # What FastAPI does with response_model: validate from attributes,
+        # dump to JSON-compatible Python, then json.dumps
+        session = SessionLocal()
+        try:
+            tasks = TaskRepository(session).get_page_by_project_id(project_id, size)
+            page = page_adapter.validate_python(
+                {"items": tasks, "next_cursor": None}, from_attributes=True
+            )
+            content = page_adapter.dump_python(page, mode="json")
+            return json.dumps(content, separators=(",", ":")).encode()
+        finally:
+            session.close()
+
+    def row_path(project_id: int, size: int) -> bytes:
+        session = SessionLocal()
+        try:
+            rows = TaskRepository(session).get_row_page_by_project_id(
+                columns, project_id, size
+            )
+            content = {"items": [row._asdict() for row in rows], "next_cursor": None}
+            return PydanticJSONResponse(content).body
+        finally:
+            session.close()
+
+    results = {}
+    for size in sizes:
+        project_id = seed(size)
+        assert json.loads(orm_path(project_id, size)) == json.loads(row_path(project_id, size))
+
+        timings = {}
+        for name, path in (("orm", orm_path), ("rows", row_path)):
+            latencies = []
+            for _ in range(iterations):
+                with timed(latencies):
+                    path(project_id, size)
+            timings[name] = statistics.mean(latencies) * 1000
+
+        results[size] = {
+            "orm_ms": timings["orm"],
+            "rows_ms": timings["rows"],
+            "speedup": timings["orm"] / timings["rows"],
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--database-url", default="")
+    args = parser.parse_args()
+
+    configure_database(args.database_url)
+    print(json.dumps(run(args.sizes, args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""Benchmark repositories, services and API endpoints against a seeded database.
+
+Seeds --projects projects with --tasks-per-project tasks each (a share of them
+overdue), then times repository calls, TaskService.close_overdue_tasks and the
+HTTP endpoints through an in-process ASGI client. The JSON report can be
+compared between commits with python -m benchmarks.compare.
+
+Usage: python -m benchmarks.suite [--projects N] [--tasks-per-project N]
+       [--iterations N] [--database-url URL] [--output FILE]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.common import (
+    StatementCounter,
+    configure_database,
+    create_schema,
+    git_revision,
+    summarize,
+    timed,
+)
+
+OVERDUE_EVERY = 10  # every Nth task is seeded with a deadline in the past
+
+
+class Suite:
+
+    def __init__(self, iterations: int):
+        self.iterations = iterations
+        self.counter = StatementCounter()
+        self.results: Dict[str, Dict[str, float]] = {}
+
+    def measure(
+        self,
+        name: str,
+        call: Callable[[], Any],
+        setup: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        call()  # warm-up: connections, caches, statement compilation
+        latencies: List[float] = []
+        statements: List[int] = []
+        for _ in range(self.iterations):
+            if setup is not None:
+                setup()
+            with self.counter.counting(), timed(latencies):
+                call()
+            statements.append(self.counter.count)
+        self.results[name] = {
+            **summarize(latencies),
+            "statements": sum(statements) / len(statements),
+        }
+
+    async def measure_async(self, name: str, call: Callable[[], Any]) -> None:
+        await call()
+        latencies: List[float] = []
+        statements: List[int] = []
+        for _ in range(self.iterations):
+            with self.counter.counting(), timed(latencies):
+                await call()
+            statements.append(self.counter.count)
+        self.results[name] = {
+            **summarize(latencies),
+            "statements": sum(statements) / len(statements),
+        }
+
+
+def seed(projects: int, tasks_per_project: int) -> List[int]:
+    from app.db.session import SessionLocal
+    from app.repositories.project_repository import ProjectRepository
+    from app.repositories.task_repository import TaskRepository
+
+    now = datetime.now()
+    session = SessionLocal()
+    try:
+        project_repository = ProjectRepository(session)
+        task_repository = TaskRepository(session)
+        project_ids = []
+        for i in range(projects):
+            project = project_repository.create(f"bench {i}", "benchmark project")
+            task_repository.insert_many(
+                project.id,
+                [
+                    {
+                        "title": f"task {j}",
+                        "description": "benchmark task",
+                        "deadline": now - timedelta(days=1)
+                        if j % OVERDUE_EVERY == 0
+                        else now + timedelta(days=j % 30 + 1),
+                    }
+                    for j in range(tasks_per_project)
+                ],
+            )
+            project_ids.append(project.id)
+        session.commit()
+        return project_ids
+    finally:
+        session.close()
+
+
+def reopen_overdue() -> None:
+    from sqlalchemy import update
+
+    from app.db.session import SessionLocal
+    from app.models.task import Task
+
+    session = SessionLocal()
+    try:
+        session.execute(
+            update(Task)
+            .where(Task.deadline < datetime.now())
+            .values(status="todo", closed_at=None)
+        )
+        session.commit()
+    finally:
+        session.close()
+
+
+def bench_repositories(suite: Suite, project_id: int, task_id: int) -> None:
+    from app.api.v1.schemas import TaskResponse
+    from app.api.v1.serialization import response_columns
+    from app.db.session import SessionLocal
+    from app.models.task import Task
+    from app.repositories.project_repository import ProjectRepository
+    from app.repositories.task_repository import TaskRepository
+    from app.services.task_service import TaskService
+
+    task_columns = response_columns(Task, TaskResponse)
+    new_tasks = [
+        {"title": f"bulk {i}", "description": "benchmark task"} for i in range(100)
+    ]
+
+    def in_session(operation: Callable[[Any], Any], commit: bool = False):
+        def run():
+            session = SessionLocal()
+            try:
+                operation(session)
+                if commit:
+                    session.commit()
+                else:
+                    session.rollback()
+            finally:
+                session.close()
+
+        return run
+
+    suite.measure(
+        "repository.project.get_page",
+        in_session(lambda s: ProjectRepository(s).get_page(100)),
+    )
+    suite.measure(
+        "repository.project.get_by_id",
+        in_session(lambda s: ProjectRepository(s).get_by_id(project_id)),
+    )
+    suite.measure(
+        "repository.project.get_summaries",
+        in_session(
+            lambda s: ProjectRepository(s).get_summaries(
+                TaskService.valid_statuses, datetime.now()
+            )
+        ),
+    )
+    suite.measure(
+        "repository.task.get_by_id",
+        in_session(lambda s: TaskRepository(s).get_by_id(task_id)),
+    )
+    suite.measure(
+        "repository.task.get_page_by_project_id",
+        in_session(lambda s: TaskRepository(s).get_page_by_project_id(project_id, 100)),
+    )
+    suite.measure(
+        "repository.task.get_row_page_by_project_id",
+        in_session(
+            lambda s: TaskRepository(s).get_row_page_by_project_id(
+                task_columns, project_id, 100
+            )
+        ),
+    )
+    suite.measure(
+        "repository.task.count_by_project_id",
+        in_session(lambda s: TaskRepository(s).count_by_project_id(project_id)),
+    )
+    # Rolled back so the dataset stays the same size across iterations
+    suite.measure(
+        "repository.task.create_many_100",
+        in_session(lambda s: TaskRepository(s).create_many(project_id, new_tasks)),
+    )
+    suite.measure(
+        "service.task.close_overdue_tasks",
+        in_session(
+            lambda s: TaskService(TaskRepository(s), ProjectRepository(s)).close_overdue_tasks(),
+            commit=True,
+        ),
+        setup=reopen_overdue,
+    )
+
+
+async def bench_api(suite: Suite, project_id: int, task_id: int) -> None:
+    import httpx
+
+    from app.api.app import app
+    from app.db.session import dispose_async_engine
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        tasks_url = f"/api/v1/projects/{project_id}/tasks"
+
+        async def get(url: str, **kwargs):
+            response = await client.get(url, **kwargs)
+            assert response.status_code in (200, 304), response.text
+            return response
+
+        list_etag = (await get(f"{tasks_url}/?limit=100")).headers["etag"]
+
+        async def create_and_delete():
+            response = await client.post(
+                f"{tasks_url}/", json={"title": "api", "description": "benchmark"}
+            )
+            assert response.status_code == 201, response.text
+            await client.delete(f"{tasks_url}/{response.json()['id']}")
+
+        await suite.measure_async("api.projects.list", lambda: get("/api/v1/projects/"))
+        await suite.measure_async(
+            "api.projects.summary", lambda: get("/api/v1/projects/summary")
+        )
+        await suite.measure_async(
+            "api.projects.list_include_tasks",
+            lambda: get("/api/v1/projects/?include=tasks&limit=10"),
+        )
+        await suite.measure_async(
+            "api.tasks.list_100", lambda: get(f"{tasks_url}/?limit=100")
+        )
+        await suite.measure_async(
+            "api.tasks.list_1000", lambda: get(f"{tasks_url}/?limit=1000")
+        )
+        await suite.measure_async(
+            "api.tasks.list_not_modified",
+            lambda: get(f"{tasks_url}/?limit=100", headers={"If-None-Match": list_etag}),
+        )
+        await suite.measure_async(
+            "api.tasks.get", lambda: get(f"{tasks_url}/{task_id}")
+        )
+        await suite.measure_async(
+            "api.tasks.export_ndjson", lambda: get(f"{tasks_url}/export")
+        )
+        await suite.measure_async("api.tasks.create_and_delete", create_and_delete)
+
+    # ASGITransport skips the lifespan, so release async connections (and
+    # their driver threads) before the event loop closes
+    await dispose_async_engine()
+
+
+def run(projects: int, tasks_per_project: int, iterations: int) -> Dict[str, Any]:
+    import sqlalchemy
+
+    from app.db.session import get_engine
+
+    create_schema()
+    project_ids = seed(projects, tasks_per_project)
+    project_id = project_ids[0]
+    task_id = tasks_per_project // 2 + 1
+
+    suite = Suite(iterations)
+    bench_repositories(suite, project_id, task_id)
+    asyncio.run(bench_api(suite, project_id, task_id))
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "database": get_engine().dialect.name,
+            "async_api": os.getenv("DATABASE_ASYNC", "false"),
+            "projects": projects,
+            "tasks_per_project": tasks_per_project,
+            "iterations": iterations,
+        },
+        "results": suite.results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--tasks-per-project", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--database-url", default="")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    configure_database(args.database_url)
+    # Seeding goes through repositories, but the API limits still apply to
+    # the write benchmarks
+    os.environ["MAX_NUMBER_OF_PROJECTS"] = str(args.projects + 1)
+    os.environ["MAX_NUMBER_OF_TASKS_PER_PROJECT"] = str(args.tasks_per_project + 1)
+
+    report = run(args.projects, args.tasks_per_project, args.iterations)
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Wrote {len(report['results'])} results to {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
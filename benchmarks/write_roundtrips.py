@@ -0,0 +1,75 @@
+"""Count SQL statements and latency for each write endpoint.
+
+Usage: python -m benchmarks.write_roundtrips [--iterations N] [--database-url URL]
+"""
+import argparse
+import json
+import statistics
+
+from benchmarks.common import StatementCounter, configure_database, create_schema, timed
+
+
+def run(iterations: int) -> dict:
+    from fastapi.testclient import TestClient
+
+    from app.api.app import app
+
+    create_schema()
+    client = TestClient(app)
+    counter = StatementCounter()
+    results = {}
+
+    def measure(name, call):
+        statements, latencies = [], []
+        for i in range(iterations):
+            with counter.counting(), timed(latencies):
+                response = call(i)
+            assert response.status_code < 300, response.text
+            statements.append(counter.count)
+        results[name] = {
+            "statements": statistics.mean(statements),
+            "mean_ms": statistics.mean(latencies) * 1000,
+        }
+
+    project_id = client.post(
+        "/api/v1/projects/", json={"name": "bench", "description": "benchmark"}
+    ).json()["id"]
+    tasks_url = f"/api/v1/projects/{project_id}/tasks"
+    task_ids = [
+        client.post(f"{tasks_url}/", json={"title": f"seed {i}", "description": "x"}).json()["id"]
+        for i in range(iterations * 2)
+    ]
+
+    measure(
+        "create_project",
+        lambda i: client.post(
+            "/api/v1/projects/", json={"name": f"p{i}", "description": "benchmark"}
+        ),
+    )
+    measure(
+        "create_task",
+        lambda i: client.post(f"{tasks_url}/", json={"title": f"t{i}", "description": "x"}),
+    )
+    measure(
+        "update_task_status",
+        lambda i: client.patch(f"{tasks_url}/{task_ids[i]}/status", json={"status": "done"}),
+    )
+    measure(
+        "delete_task",
+        lambda i: client.delete(f"{tasks_url}/{task_ids[iterations + i]}"),
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--database-url", default="")
+    args = parser.parse_args()
+
+    configure_database(args.database_url)
+    print(json.dumps(run(args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()